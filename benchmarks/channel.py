@@ -0,0 +1,58 @@
+"""Throughput and round-trip latency of hid.channel over the loopback transport."""
+import os
+import threading
+import time
+
+from hid.channel import Channel
+from hid.devices import VendorDevice
+from hid.transport import LoopbackTransport
+
+SIZE = 4 << 20
+PINGS = 1000
+
+
+def main() -> None:
+    device = VendorDevice('data')
+    device.transport = LoopbackTransport()
+    gadget_side = Channel(device.open())
+    host_side = Channel(device.transport.host)
+
+    payload = os.urandom(SIZE)
+    received = bytearray()
+
+    def sink() -> None:
+        while len(received) < SIZE:
+            received.extend(host_side.recv())
+
+    t = threading.Thread(target=sink)
+    start = time.perf_counter()
+    t.start()
+    gadget_side.send(payload)
+    gadget_side.flush()
+    t.join()
+    elapsed = time.perf_counter() - start
+    assert received == payload
+    print(f'throughput: {SIZE / elapsed / 1e6:.2f} MB/s ({gadget_side.retransmissions} retransmissions)')
+
+    def echo() -> None:
+        for _ in range(PINGS):
+            gadget_side.send(gadget_side.recv(1))
+
+    t = threading.Thread(target=echo)
+    t.start()
+    rtts = []
+    for i in range(PINGS):
+        start = time.perf_counter()
+        host_side.send(bytes([i % 256]))
+        assert host_side.recv(1) == bytes([i % 256])
+        rtts.append(time.perf_counter() - start)
+    t.join()
+    rtts.sort()
+    print(f'round trip: median {rtts[len(rtts) // 2] * 1e6:.0f} us, p99 {rtts[len(rtts) * 99 // 100] * 1e6:.0f} us')
+
+    gadget_side.close()
+    host_side.close()
+
+
+if __name__ == '__main__':
+    main()
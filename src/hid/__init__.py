@@ -1 +1,2 @@
-from .gadget import Gadget
\ No newline at end of file
+from ._version import __version__
+from .gadget import Gadget
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import io
+import select
+import struct
+import time
+from collections import deque
+from typing import Callable, Optional
+
+from typing_extensions import Buffer
+
+from hid.transport import Transport
+
+# Each report carries one frame:
+#
+#   flags | seq | ack | length | payload (report length - 4 bytes)
+#
+# `seq` numbers data frames modulo 256 and `ack` is the next sequence number the sender
+# expects, acknowledging everything before it. Frames are sent go-back-N: up to `window`
+# data frames may be unacknowledged, and all of them are resent if the oldest isn't
+# acknowledged within `timeout`.
+
+DATA = 0x01
+ACK = 0x02
+FIN = 0x04
+
+_HEADER = struct.Struct('<BBBB')
+_SEQ_SPACE = 256
+
+
+class Channel:
+    def __init__(self, transport: Transport, report_len: int = 64, window: int = 16, timeout: float = 0.05) -> None:
+        if not 0 < window < _SEQ_SPACE // 2:
+            raise ValueError(f'Window must be between 1 and {_SEQ_SPACE // 2 - 1}.')
+        self.transport = transport
+        self.report_len = report_len
+        self.payload_len = report_len - _HEADER.size
+        self.window = window
+        self.timeout = timeout
+
+        self._poller = select.poll()
+        self._poller.register(transport.fileno(), select.POLLIN)
+        self._rx = bytearray(report_len)
+        self._tx = bytearray(report_len)
+
+        self._outgoing = bytearray()
+        self._unacked: deque[bytes] = deque()
+        self._base = 0
+        self._next = 0
+        self._sent_at = 0.0
+        self._fin_queued = False
+        self._closed = False
+
+        self._incoming = bytearray()
+        self._expected = 0
+        self._ack_due = False
+        self.eof = False
+        self._reset = False
+
+        self.retransmissions = 0
+
+    def __enter__(self) -> Channel:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _write_frame(self, flags: int, seq: int, payload: Buffer = b'') -> bytes:
+        data = memoryview(payload).cast('B')
+        n = len(data)
+        _HEADER.pack_into(self._tx, 0, flags | ACK, seq, self._expected, n)
+        self._tx[_HEADER.size:_HEADER.size + n] = data
+        self._tx[_HEADER.size + n:] = bytes(self.payload_len - n)
+        self.transport.write(self._tx)
+        self._ack_due = False
+        return bytes(self._tx)
+
+    def _transmit(self) -> None:
+        now = time.monotonic()
+        if self._unacked and now - self._sent_at >= self.timeout:
+            for frame in self._unacked:
+                # refresh the piggybacked ack
+                self._write_frame(frame[0], frame[1], memoryview(frame)[_HEADER.size:_HEADER.size + frame[3]])
+            self.retransmissions += len(self._unacked)
+            self._sent_at = now
+
+        while len(self._unacked) < self.window and (self._outgoing or self._fin_queued):
+            payload = self._outgoing[:self.payload_len]
+            del self._outgoing[:self.payload_len]
+            flags = DATA
+            if not self._outgoing and self._fin_queued:
+                flags |= FIN
+                self._fin_queued = False
+            if not self._unacked:
+                self._sent_at = now
+            self._unacked.append(self._write_frame(flags, self._next, payload))
+            self._next = (self._next + 1) % _SEQ_SPACE
+
+        if self._ack_due:
+            self._write_frame(0, self._next)
+
+    def _receive(self, frame: memoryview) -> None:
+        flags, seq, ack, n = _HEADER.unpack_from(frame)
+        if flags & ACK:
+            acked = (ack - self._base) % _SEQ_SPACE
+            if 0 < acked <= len(self._unacked):
+                for _ in range(acked):
+                    self._unacked.popleft()
+                self._base = ack
+                self._sent_at = time.monotonic()
+        if flags & DATA:
+            if seq == self._expected:
+                self._incoming += frame[_HEADER.size:_HEADER.size + n]
+                self._expected = (self._expected + 1) % _SEQ_SPACE
+                if flags & FIN:
+                    self.eof = True
+            # out of order or duplicate frames are dropped but still acknowledged
+            self._ack_due = True
+
+    def pump(self, timeout: float = 0) -> None:
+        self._transmit()
+        wait = timeout
+        while self._poller.poll(wait * 1000):
+            n = self.transport.readinto(self._rx)
+            if n == 0:
+                # the other end has gone away, poll() would keep reporting it
+                self._reset = True
+                return
+            if n < _HEADER.size:
+                break
+            with memoryview(self._rx) as m:
+                self._receive(m[:n])
+            wait = 0
+        self._transmit()
+
+    def _wait(self, done: Callable[[], bool], timeout: Optional[float]) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not done():
+            # what arrived before the other end went away is still delivered
+            if self._reset:
+                raise ConnectionResetError('The other end of the channel went away.')
+            remaining = self.timeout if deadline is None else min(deadline - time.monotonic(), self.timeout)
+            if remaining < 0:
+                return False
+            self.pump(remaining)
+        return True
+
+    def send(self, data: Buffer, timeout: Optional[float] = None) -> int:
+        if self._closed:
+            raise ValueError('Channel is closed.')
+        self._outgoing += data
+        self._transmit()
+        # don't let the send buffer grow past what the window can take
+        self._wait(lambda: len(self._outgoing) < self.window * self.payload_len, timeout)
+        return memoryview(data).nbytes
+
+    def recv(self, n: int = -1, timeout: Optional[float] = None) -> bytes:
+        # b'' only ever means end of stream
+        if not self._wait(lambda: bool(self._incoming) or self.eof, timeout):
+            raise TimeoutError('Nothing was received in time.')
+        if n < 0:
+            n = len(self._incoming)
+        data = bytes(self._incoming[:n])
+        del self._incoming[:n]
+        return data
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        return self._wait(lambda: not self._outgoing and not self._unacked and not self._fin_queued, timeout)
+
+    def close(self, timeout: Optional[float] = 1) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._fin_queued = True
+        try:
+            self.flush(timeout)
+        except ConnectionError:
+            # nobody is left to flush to
+            pass
+
+    def makefile(self) -> ChannelIO:
+        return ChannelIO(self)
+
+
+class ChannelIO(io.RawIOBase):
+    def __init__(self, channel: Channel) -> None:
+        self.channel = channel
+
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Buffer) -> int:
+        data = self.channel.recv(memoryview(buffer).nbytes)
+        memoryview(buffer).cast('B')[:len(data)] = data
+        return len(data)
+
+    def write(self, data: Buffer) -> int:
+        return self.channel.send(data)
+
+    def flush(self) -> None:
+        # a closed channel has flushed all it's going to, the peer may be gone
+        if not self.closed and not self.channel.closed:
+            self.channel.flush()
+
+    def close(self) -> None:
+        if not self.closed:
+            self.channel.close()
+        super().close()
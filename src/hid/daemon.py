@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Iterable, Mapping, Optional
+
+from typing_extensions import Buffer, Self
+
+from hid.devices.hid_device import HIDDevice
+from hid.ring import Ring
+from hid.udc import UDCState, SUSPENDED
+
+DEFAULT_DIRECTORY = '/dev/shm/hidpy'
+MANIFEST = 'devices'
+RING_SUFFIX = '.ring'
+
+
+class ReportDaemon:
+    def __init__(self,
+                 devices: Iterable[HIDDevice],
+                 directory: str = DEFAULT_DIRECTORY,
+                 intervals: Optional[Mapping[str, float]] = None,
+                 idle: float = 0.001,
+                 scan_interval: float = 0.1,
+                 udc: Optional[UDCState] = None) -> None:
+        self.devices = list(devices)
+        self.directory = directory
+        self.idle = idle
+        self.scan_interval = scan_interval
+
+        if intervals is None:
+            intervals = {}
+        # devices that know their polling rate are paced by it unless told otherwise
+        self.intervals = [intervals.get(d.name, 1 / d.frequency if hasattr(d, 'frequency') else 0.0)
+                          for d in self.devices]
+        self._deadlines = [0.0] * len(self.devices)
+        self._rings: dict[str, Ring] = {}
+        self._order: list[str] = []
+        self._start = 0
+        self._last_scan = 0.0
+        self._stop = threading.Event()
+
+        # reports stay queued while the host has the bus suspended
+        self.udc = udc
+        if udc is not None:
+            udc.start()
+
+        os.makedirs(directory, exist_ok=True)
+        tmp = os.path.join(directory, f'.{MANIFEST}.tmp')
+        with open(tmp, 'wt') as f:
+            for d in self.devices:
+                f.write(f'{d.name}\t{d.DESCRIPTOR.input_len}\n')
+        os.replace(tmp, os.path.join(directory, MANIFEST))
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.stop()
+        for ring in self._rings.values():
+            ring.close()
+        self._rings.clear()
+        self._order.clear()
+        os.remove(os.path.join(self.directory, MANIFEST))
+
+    def scan(self) -> None:
+        names = {f[:-len(RING_SUFFIX)] for f in os.listdir(self.directory) if f.endswith(RING_SUFFIX)}
+        for name in names - self._rings.keys():
+            try:
+                self._rings[name] = Ring.open(os.path.join(self.directory, name + RING_SUFFIX))
+            except (OSError, ValueError):
+                continue
+            self._order.append(name)
+        # clients unlink their ring when they're done; drop it once it's drained
+        for name in self._rings.keys() - names:
+            if not len(self._rings[name]):
+                self._rings.pop(name).close()
+                self._order.remove(name)
+        self._last_scan = time.monotonic()
+
+    def poll(self) -> int:
+        if time.monotonic() - self._last_scan >= self.scan_interval:
+            self.scan()
+        if self.udc is not None and self.udc.state == SUSPENDED:
+            return 0
+
+        # round robin, one report per client per pass, rotating who goes first
+        sent = 0
+        n = len(self._order)
+        progress = True
+        while progress:
+            progress = False
+            for i in range(n):
+                ring = self._rings[self._order[(self._start + i) % n]]
+                entry = ring.peek()
+                if entry is None:
+                    continue
+                _, device, report = entry
+                now = time.monotonic()
+                if device < len(self.devices) and now < self._deadlines[device]:
+                    continue
+
+                ok = True
+                try:
+                    self.devices[device].send_report(report)
+                # unknown devices, devices that can't be opened and rejected reports
+                except (IndexError, NotImplementedError, OSError, ValueError):
+                    ok = False
+                else:
+                    self._deadlines[device] = now + self.intervals[device]
+                    sent += 1
+                finally:
+                    report.release()
+                ring.pop(ok)
+                progress = True
+        if n:
+            self._start = (self._start + 1) % n
+        return sent
+
+    def next_deadline(self) -> float:
+        pending = [self._deadlines[entry[1]] for entry in map(Ring.peek, self._rings.values())
+                   if entry is not None and entry[1] < len(self.devices)]
+        return min(pending, default=time.monotonic() + self.idle)
+
+    def run(self) -> None:
+        self._stop.clear()
+        while not self._stop.is_set():
+            if self.udc is not None and self.udc.state == SUSPENDED:
+                self.udc.wait_while((SUSPENDED,), self.scan_interval)
+                continue
+            if not self.poll():
+                delay = min(self.next_deadline() - time.monotonic(), self.idle)
+                if delay > 0:
+                    self._stop.wait(delay)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+class ReportClient:
+    def __init__(self,
+                 directory: str = DEFAULT_DIRECTORY,
+                 name: Optional[str] = None,
+                 capacity: int = 256) -> None:
+        self.directory = directory
+        self.name = name if name is not None else str(os.getpid())
+
+        self._devices: dict[str, tuple[int, int]] = {}
+        with open(os.path.join(directory, MANIFEST), 'rt') as f:
+            for i, line in enumerate(f):
+                device, length = line.rstrip('\n').split('\t')
+                self._devices[device] = (i, int(length))
+
+        max_report_len = max((n for _, n in self._devices.values()), default=0)
+        self.ring = Ring.create(os.path.join(directory, self.name + RING_SUFFIX), capacity, max_report_len)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        os.remove(self.ring.path)
+        self.ring.close()
+
+    @property
+    def devices(self) -> list[str]:
+        return list(self._devices)
+
+    @property
+    def acked(self) -> int:
+        return self.ring.tail
+
+    @property
+    def failed(self) -> int:
+        return self.ring.failed
+
+    def submit(self, device: str, report: Buffer, timeout: Optional[float] = None) -> int:
+        i, length = self._devices[device]
+        if memoryview(report).nbytes != length:
+            raise ValueError(f'Report must be {length} bytes long, not {memoryview(report).nbytes}.')
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            seq = self.ring.push(i, report)
+            if seq is not None:
+                return seq
+            if deadline is not None and time.monotonic() >= deadline:
+                raise BlockingIOError('Ring is full.')
+            time.sleep(0.0005)
+
+    def wait(self, seq: Optional[int] = None, timeout: Optional[float] = None) -> bool:
+        if seq is None:
+            seq = self.ring.head
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.ring.tail < seq:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.0005)
+        return True
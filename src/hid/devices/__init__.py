@@ -1,2 +1,3 @@
 from .keyboard import Keyboard
 from .mouse import Mouse
+from .vendor import VendorDevice
@@ -1,32 +1,73 @@
 from __future__ import annotations
 
-import os
+from ctypes import Structure, sizeof
+from typing import Union
 
+from typing_extensions import Buffer
+
+from hid import trace
 from hid.report import *
+from hid.transport import Transport, DeviceTransport
 
 
 class HIDDevice:
     DESCRIPTOR: ReportDescriptor = NotImplemented
+    REPORT: Type[Structure] = NotImplemented
     PROTOCOL = ProtocolCode.NONE
     SUBCLASS = SubclassCode.NONE
+    _INPUT_LEN: int = NotImplemented
+    _OUTPUT_LEN: int = NotImplemented
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.DESCRIPTOR is NotImplemented:
+            return
+        cls._INPUT_LEN = cls.DESCRIPTOR.input_len
+        cls._OUTPUT_LEN = cls.DESCRIPTOR.output_len
+        if cls.REPORT is not NotImplemented and sizeof(cls.REPORT) != cls._INPUT_LEN:
+            raise ValueError(f'{cls.REPORT.__name__} is {sizeof(cls.REPORT)} bytes long, '
+                             f'but the descriptor specifies {cls._INPUT_LEN}.')
 
     def __init__(self, name: str) -> None:
         self.name = name
         self.dev = NotImplemented
-        # threading.Thread(target=self._listener).start()
-
-    def send_report(self, report: SupportsBytes | Iterable[SupportsIndex]) -> None:
-        report = bytes(report)
-        if self.dev is NotImplemented:
-            raise NotImplementedError
-        if not os.path.exists(self.dev):
-            raise FileNotFoundError
-        if not self.DESCRIPTOR.validate_input_report(report):
-            raise ValueError
-        with open(self.dev, 'wb') as fd:
-            fd.write(report)
-
-    def _listener(self) -> None:
-        while os.path.exists(self.dev):
-            with open(self.dev, 'rb') as fd:
-                self.output = fd.read(self.DESCRIPTOR.output_len)
+        self.transport: Optional[Transport] = None
+        self.report: Union[Structure, bytearray] = (
+            self.REPORT() if self.REPORT is not NotImplemented else bytearray(self._INPUT_LEN)
+        )
+        self.output = bytearray(self._OUTPUT_LEN if self._OUTPUT_LEN is not NotImplemented else 0)
+
+    def open(self) -> Transport:
+        if self.transport is None:
+            if self.dev is NotImplemented:
+                raise NotImplementedError
+            self.transport = DeviceTransport(self.dev)
+        return self.transport
+
+    def fileno(self) -> int:
+        return self.open().fileno()
+
+    def close(self) -> None:
+        if self.transport is not None:
+            self.transport.close()
+            self.transport = None
+
+    def send_report(self, report: Optional[Union[Buffer, Iterable[SupportsIndex]]] = None) -> None:
+        if report is None:
+            report = self.report
+        else:
+            try:
+                n = memoryview(report).nbytes  # type: ignore[arg-type]
+            except TypeError:
+                report = bytes(report)  # type: ignore[arg-type]
+                n = len(report)
+            if n != self._INPUT_LEN:
+                raise ValueError(f'Report must be {self._INPUT_LEN} bytes long, not {n}.')
+        (self.transport or self.open()).write(report)  # type: ignore[arg-type]
+        if trace.enabled:
+            trace.instant('report written', device=self.name)
+
+    def receive_report(self, buffer: Optional[Buffer] = None) -> int:
+        if buffer is None:
+            buffer = self.output
+        return (self.transport or self.open()).readinto(buffer)
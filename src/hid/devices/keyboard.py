@@ -2,15 +2,20 @@ from __future__ import annotations
 
 import string
 from ctypes import Structure, c_ubyte
+from typing import Union
 
 from typing_extensions import Self
 
+from hid import trace
 from hid.report import ProtocolCode, SubclassCode, ReportDescriptor
 from hid.report.item import *
-from hid.report.usage import UsagePages, LED
+from hid.report.usage import UsagePages, GenericDesktop, LED
 from .hid_device import HIDDevice
 
 
+_SHIFTED = frozenset(string.ascii_uppercase + '!@#$%^&*()_+{}|:"~<>?')
+
+
 class Modifier(IntFlag):
     NULL = 0
     LEFT_CONTROL = auto()
@@ -26,7 +31,7 @@ class Modifier(IntFlag):
     def from_char(cls, char: str, left: bool = True) -> Modifier:
         if len(char) != 1:
             raise ValueError
-        if char in string.ascii_uppercase + '!@#$%^&*()_+{}|:"~<>?':
+        if char in _SHIFTED:
             return cls.LEFT_SHIFT if left else cls.RIGHT_SHIFT
         else:
             return cls.NULL
@@ -70,7 +75,7 @@ class KeyboardReport(Structure):
 class Keyboard(HIDDevice):
     DESCRIPTOR = ReportDescriptor((
         UsagePage(UsagePages.GENERIC_DESKTOP),
-        Usage(6),
+        Usage(GenericDesktop.KEYBOARD),
         Collection(CollectionType.APPLICATION),
         (
             UsagePage(UsagePages.KEYBOARD),
@@ -88,9 +93,9 @@ class Keyboard(HIDDevice):
 
             ReportCount(5),
             ReportSize(1),
-            UsagePage(8),
-            UsageMinimum(1),
-            UsageMaximum(5),
+            UsagePage(UsagePages.LED),
+            UsageMinimum(LED.NUM_LOCK),
+            UsageMaximum(LED.KANA),
             Output(DataFlag.VARIABLE),
 
             ReportCount(1),
@@ -101,20 +106,102 @@ class Keyboard(HIDDevice):
             ReportSize(8),
             LogicalMinimum(0),
             LogicalMaximum(0x65),
-            UsagePage(7),
+            UsagePage(UsagePages.KEYBOARD),
             UsageMinimum(0),
             UsageMaximum(0x65),
             Input(0),
         ),
         EndCollection()
     ))
+    REPORT = KeyboardReport
     PROTOCOL = ProtocolCode.KEYBOARD
     SUBCLASS = SubclassCode.BOOT_INTERFACE
+    report: KeyboardReport
+
+    def __init__(self, *args) -> None:
+        # modifiers pressed on their own, which releasing a shifted character leaves held
+        self._held_mods = 0
+        super().__init__(*args)
+
+    @staticmethod
+    def _code(key: Union[str, int]) -> int:
+        if isinstance(key, Modifier):
+            return 0
+        if isinstance(key, str):
+            return KeyCode.KEYBOARD[key]
+        return key
+
+    @staticmethod
+    def _shift(key: Union[str, int]) -> int:
+        # characters that need shift bring it along
+        return Modifier.from_char(key) if isinstance(key, str) and len(key) == 1 else 0
+
+    def _free_slot(self) -> int:
+        keys = self.report.keys
+        for i in range(len(keys)):
+            if not keys[i]:
+                return i
+        raise ValueError(f"Can't press more than {len(keys)} keys at once.")
+
+    # press() and release() only change the report, e.g. to build a gesture with a
+    # FrameScheduler; send_report() or a scheduler commit sends it
+
+    def press(self, *keys: Union[str, int]) -> Self:
+        # look every key up first so an unknown one doesn't leave the others pressed
+        for key in keys:
+            self._code(key)
+        report = self.report
+        pressed = report.keys
+        for key in keys:
+            if isinstance(key, Modifier):
+                self._held_mods |= key
+                report.mods |= key
+                continue
+            report.mods |= self._shift(key)
+            code = self._code(key)
+            if code and code not in pressed:
+                pressed[self._free_slot()] = code
+        return self
+
+    def release(self, *keys: Union[str, int]) -> Self:
+        for key in keys:
+            self._code(key)
+        report = self.report
+        pressed = report.keys
+        for key in keys:
+            if isinstance(key, Modifier):
+                self._held_mods &= ~key
+                report.mods &= ~key
+                continue
+            report.mods &= ~(self._shift(key) & ~self._held_mods)
+            code = self._code(key)
+            for i in range(len(pressed)):
+                if code and pressed[i] == code:
+                    pressed[i] = 0
+        return self
+
+    def release_all(self) -> Self:
+        self._held_mods = 0
+        self.report.mods = 0
+        self.report.keys[:] = bytes(len(self.report.keys))
+        return self
 
     def type(self, text: str) -> Self:
-        for c in text:
-            self.send_report(KeyboardReport(mods=Modifier.from_char(c), keys=(c_ubyte * 6)(KeyCode.KEYBOARD[c])))
-            self.send_report(KeyboardReport())
+        with trace.span('Keyboard.type', length=len(text)):
+            report = self.report
+            keys = report.keys
+            # anything held with press() stays held while typing
+            held = report.mods
+            slot = self._free_slot()
+            for c in text:
+                # look the key up first so an unknown character doesn't leave modifiers held
+                key = KeyCode.KEYBOARD[c]
+                report.mods = held | Modifier.from_char(c)
+                keys[slot] = key
+                self.send_report()
+                report.mods = held
+                keys[slot] = 0
+                self.send_report()
         return self
 
     @property
@@ -5,9 +5,10 @@ from math import floor
 from time import sleep
 from typing import Literal
 
+from hid import trace
 from hid.report import ProtocolCode, SubclassCode, ReportDescriptor
 from hid.report.item import *
-from hid.report.usage import UsagePages
+from hid.report.usage import UsagePages, GenericDesktop
 from .hid_device import HIDDevice
 
 
@@ -27,10 +28,10 @@ class MouseReport(Structure):
 class Mouse(HIDDevice):
     DESCRIPTOR = ReportDescriptor((
         UsagePage(UsagePages.GENERIC_DESKTOP),
-        Usage(2),
+        Usage(GenericDesktop.MOUSE),
         Collection(CollectionType.APPLICATION),
         (
-            Usage(1),
+            Usage(GenericDesktop.POINTER),
             Collection(CollectionType.PHYSICAL),
             (
                 UsagePage(UsagePages.BUTTON),
@@ -47,8 +48,8 @@ class Mouse(HIDDevice):
                 Input(DataFlag.CONSTANT | DataFlag.VARIABLE),
 
                 UsagePage(UsagePages.GENERIC_DESKTOP),
-                Usage(0x30),
-                Usage(0x31),
+                Usage(GenericDesktop.X),
+                Usage(GenericDesktop.Y),
                 LogicalMinimum(-127),
                 LogicalMaximum(127),
                 ReportSize(8),
@@ -59,16 +60,23 @@ class Mouse(HIDDevice):
         ),
         EndCollection()
     ))
+    REPORT = MouseReport
     PROTOCOL = ProtocolCode.MOUSE
     SUBCLASS = SubclassCode.BOOT_INTERFACE
+    report: MouseReport
 
     def __init__(self, *args, frequency: int = 250):
         self.frequency = frequency
-        self._buttons = 0
         self._x = 0
         self._y = 0
         super().__init__(*args)
 
+    def _wait_frame(self) -> None:
+        if trace.enabled:
+            trace.sleep(1 / self.frequency)
+        else:
+            sleep(1 / self.frequency)
+
     def move(self, x: float = 0, y: float = 0, t: float = 0) -> Mouse:
         t = max(t, 1 / self.frequency)
 
@@ -77,30 +85,49 @@ class Mouse(HIDDevice):
         if not (-127 <= x / n <= 127 and -127 <= y / n <= 127):
             raise ValueError("Can't move that fast")
 
-        report = MouseReport(self._buttons)
-        for _ in range(n):
-            self._x += x / n
-            self._y += y / n
+        with trace.span('Mouse.move', reports=n):
+            report = self.report
+            try:
+                for _ in range(n):
+                    self._x += x / n
+                    self._y += y / n
+
+                    report.x, report.y = floor(self._x), floor(self._y)
+                    self._x -= report.x
+                    self._y -= report.y
+
+                    self.send_report()
+                    self._wait_frame()
+            finally:
+                report.x = report.y = 0
+        return self
 
-            report.x, report.y = floor(self._x), floor(self._y)
-            self._x -= report.x
-            self._y -= report.y
+    # press(), release() and set_motion() only change the report, e.g. to build a gesture
+    # with a FrameScheduler; send_report() or a scheduler commit sends it
 
-            self.send_report(report)
-            sleep(1 / self.frequency)
+    def press(self, button: int = MouseButton.LEFT) -> Mouse:
+        self.report.buttons |= button
+        return self
+
+    def release(self, button: int = MouseButton.LEFT) -> Mouse:
+        self.report.buttons &= ~button
+        return self
+
+    def set_motion(self, x: int = 0, y: int = 0) -> Mouse:
+        if not (-127 <= x <= 127 and -127 <= y <= 127):
+            raise ValueError("Can't move that far in one report")
+        self.report.x, self.report.y = x, y
         return self
 
     def click(self, button: int = MouseButton.LEFT, direction: Literal['up', 'down', 'both'] = 'both') -> Mouse:
-        if direction in ['down', 'both']:
-            self._buttons |= button
-            self.send_report(MouseReport(self._buttons))
-            sleep(1 / self.frequency)
-        if direction in ['up', 'both']:
-            self._buttons &= ~button
-            self.send_report(MouseReport(self._buttons))
-            sleep(1 / self.frequency)
-        else:
+        if direction not in ('up', 'down', 'both'):
             raise ValueError
+        if direction in ('down', 'both'):
+            self.press(button).send_report()
+            self._wait_frame()
+        if direction in ('up', 'both'):
+            self.release(button).send_report()
+            self._wait_frame()
         return self
 
     def __enter__(self) -> Mouse:
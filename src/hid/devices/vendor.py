@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from ctypes import Structure, c_ubyte
+
+from hid.report import ReportDescriptor
+from hid.report.item import *
+from .hid_device import HIDDevice
+
+REPORT_LENGTH = 64
+
+
+class VendorReport(Structure):
+    _fields_ = [('data', c_ubyte * REPORT_LENGTH)]
+
+
+class VendorDevice(HIDDevice):
+    DESCRIPTOR = ReportDescriptor((
+        UsagePage(0xFF00),
+        Usage(1),
+        Collection(CollectionType.APPLICATION),
+        (
+            LogicalMinimum(0),
+            LogicalMaximum(0xFF),
+            ReportSize(8),
+            ReportCount(REPORT_LENGTH),
+
+            Usage(2),
+            Input(DataFlag.VARIABLE),
+
+            Usage(3),
+            Output(DataFlag.VARIABLE),
+        ),
+        EndCollection()
+    ))
+    REPORT = VendorReport
+    report: VendorReport
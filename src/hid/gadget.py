@@ -3,12 +3,15 @@ from __future__ import annotations
 import os
 import platform
 from types import TracebackType
-from typing import Mapping, Optional, Union, Type, Literal, Iterable
+from typing import Callable, Mapping, Optional, Union, Type, Literal, Iterable
 
 from typing_extensions import Self
 
+from hid import trace
 from hid.devices.hid_device import HIDDevice
 from hid.helpers import Directory, SymLink
+from hid.scheduler import FrameScheduler
+from hid.udc import UDCState, CONFIGURED, SUSPENDED
 
 _KT = str
 _VT = Union[str, bytes, 'SymLink', 'Directory']
@@ -16,6 +19,9 @@ _GT = Mapping[_KT, Union[_VT, '_GT']]  # type: ignore
 
 
 class Gadget:
+    UDC_PATH = '/sys/class/udc'
+    _udc_state: UDCState
+
     def __init__(self,
                  functions: Iterable[HIDDevice],
                  vendor_id: int = 0x1d6b,
@@ -29,45 +35,109 @@ class Gadget:
         if platform.system() != 'Linux':
             raise Exception(f'Unsupported platform: {platform.system()}. Please use linux.')
 
-        self.configfs = Directory(f'{path}/hidpy', {
-            'idVendor': f'0x{vendor_id:04x}',
-            'idProduct': f'0x{product_id:04x}',
-            'bcdDevice': '0x0100',
-            'bcdUSB': '0x0200',
-            'strings': {
-                '0x409': {
-                    'serialnumber': serial_number,
-                    'manufacturer': manufacturer,
-                    'product': product_name
-                }
-            },
-            'configs': {
-                'c.1': {
-                    'strings': {
-                        '0x409': {
-                            'configuration': 'Config 1'
-                        }
-                    },
-                    'MaxPower': '250'
+        with trace.span('Gadget.__init__'):
+            self.configfs = Directory(os.path.join(path, name), {
+                'idVendor': f'0x{vendor_id:04x}',
+                'idProduct': f'0x{product_id:04x}',
+                'bcdDevice': '0x0100',
+                'bcdUSB': '0x0200',
+                'strings': {
+                    '0x409': {
+                        'serialnumber': serial_number,
+                        'manufacturer': manufacturer,
+                        'product': product_name
+                    }
+                },
+                'configs': {
+                    'c.1': {
+                        'strings': {
+                            '0x409': {
+                                'configuration': 'Config 1'
+                            }
+                        },
+                        'MaxPower': '250'
+                    }
                 }
-            }
-        })
-        self.name = name
+            })
+            self.name = name
 
-        if udc is not None:
-            self.udc = udc
-        else:
-            try:
-                self.udc = os.listdir('/sys/class/udc')[0]
-            except FileNotFoundError:
-                pass
+            if udc is not None:
+                self.udc = udc
+            else:
+                try:
+                    self.udc = os.listdir(self.UDC_PATH)[0]
+                except FileNotFoundError:
+                    pass
+
+            self._names = []
+
+            for f in functions:
+                self.add_function(f)
+                self._names.append(f.name)
+            self.enabled = True
+
+    @classmethod
+    def attach(cls,
+               name: str,
+               functions: Iterable[HIDDevice],
+               udc: Optional[str] = None,
+               path: str = '/sys/kernel/config/usb_gadget/') -> Self:
+        if platform.system() != 'Linux':
+            raise Exception(f'Unsupported platform: {platform.system()}. Please use linux.')
+
+        root = os.path.join(path, name)
+        if not os.path.isdir(root):
+            raise FileNotFoundError(f"There is no gadget named '{name}' in {path}.")
+
+        with trace.span('Gadget.attach', name=name):
+            gadget = cls.__new__(cls)
+            gadget.configfs = Directory(root)
+            gadget.name = name
+            gadget._names = []
+
+            bound = gadget.configfs['UDC']
+            if not isinstance(bound, str):
+                raise TypeError
+            if udc is not None:
+                gadget.udc = udc
+            elif bound.strip():
+                gadget.udc = bound.strip()
+            else:
+                try:
+                    gadget.udc = os.listdir(gadget.UDC_PATH)[0]
+                except FileNotFoundError:
+                    pass
+
+            functions = list(functions)
+            existing = sorted(f[len('hid.'):] for f in gadget.functions if f.startswith('hid.'))
+            requested = sorted(f.name for f in functions)
+            if existing != requested:
+                raise ValueError(f"Gadget '{name}' has the functions {existing}, not {requested}.")
+
+            for f in functions:
+                function = gadget.functions[f'hid.{f.name}']
+                if not isinstance(function, Directory):
+                    raise TypeError
+                with open(os.path.join(root, 'functions', f'hid.{f.name}', 'report_desc'), 'rb') as fd:
+                    report_desc = fd.read()
+                if report_desc != f.DESCRIPTOR:
+                    raise ValueError(f"The report descriptor of '{f.name}' doesn't match.")
+                for attribute, expected in (('protocol', f.PROTOCOL),
+                                            ('subclass', f.SUBCLASS),
+                                            ('report_length', f.DESCRIPTOR.input_len)):
+                    value = function[attribute]
+                    if not isinstance(value, str) or int(value) != expected:
+                        raise ValueError(f"The {attribute} of '{f.name}' is {value!r}, not {expected}.")
+                if not os.path.islink(os.path.join(root, f'configs/c.1/hid.{f.name}')):
+                    raise ValueError(f"'{f.name}' isn't part of the configuration.")
+                gadget._adopt_function(f)
+                gadget._names.append(f.name)
 
-        self._names = []
+            # only bind if the previous owner died before it could
+            if not bound.strip():
+                gadget.enabled = True
 
-        for f in functions:
-            self.add_function(f)
-            self._names.append(f.name)
-        self.enabled = True
+        return gadget
 
     def __dir__(self) -> Iterable[str]:
         return list(super().__dir__()) + self._names
@@ -83,6 +153,11 @@ class Gadget:
         return False
 
     def close(self) -> None:
+        for device in self.devices:
+            device.close()
+        if hasattr(self, '_udc_state'):
+            self._udc_state.stop()
+
         self.enabled = False
 
         self.configfs.pop('configs/c.1/strings/0x409')
@@ -111,7 +186,8 @@ class Gadget:
         if b and not self.enabled:
             if self.udc is None:
                 raise Exception('No UDC chosen.')
-            self.configfs['UDC'] = self.udc
+            with trace.span('UDC bind', udc=self.udc):
+                self.configfs['UDC'] = self.udc
         else:
             self.configfs['UDC'] = ''
 
@@ -123,10 +199,43 @@ class Gadget:
 
     @udc.setter
     def udc(self, udc: str) -> None:
-        if udc not in os.listdir('/sys/class/udc'):
-            raise ValueError(f"'{self.udc}' is not a valid UDC. Please choose a UDC from /sys/class/udc.")
+        if udc not in os.listdir(self.UDC_PATH):
+            raise ValueError(f"'{udc}' is not a valid UDC. Please choose a UDC from {self.UDC_PATH}.")
         self._udc = udc
 
+    @property
+    def udc_state(self) -> UDCState:
+        if self.udc is None:
+            raise Exception('No UDC chosen.')
+        path = os.path.join(self.UDC_PATH, self.udc, 'state')
+        if not hasattr(self, '_udc_state') or self._udc_state.path != path:
+            self._udc_state = UDCState(path)
+        return self._udc_state
+
+    @property
+    def state(self) -> str:
+        s = self.udc_state
+        return s.state if s.running else s.read()
+
+    @property
+    def suspended(self) -> bool:
+        return self.state == SUSPENDED
+
+    def wait_configured(self, timeout: Optional[float] = None) -> bool:
+        return self.udc_state.wait_for((CONFIGURED,), timeout)
+
+    def on_state_change(self, callback: Callable[[str, str], None]) -> None:
+        s = self.udc_state
+        s.add_callback(callback)
+        s.start()
+
+    def scheduler(self, interval: float = 0.004) -> FrameScheduler:
+        return FrameScheduler(self.devices, interval, udc=self.udc_state if self.udc is not None else None)
+
+    @property
+    def devices(self) -> list[HIDDevice]:
+        return [getattr(self, name) for name in self._names]
+
     @property
     def functions(self) -> Directory:
         f = self.configfs['functions']
@@ -135,17 +244,20 @@ class Gadget:
         return f
 
     def add_function(self, function: HIDDevice) -> None:
-        name = f'hid.{function.name}'
+        with trace.span('Gadget.add_function', name=function.name):
+            name = f'hid.{function.name}'
 
-        self.configfs[f'functions/{name}'] = {
-            'protocol': f'{function.PROTOCOL}',
-            'subclass': f'{function.SUBCLASS}',
-            'report_length': f'{function.DESCRIPTOR.input_len}',
-            'report_desc': function.DESCRIPTOR
-        }
-        self.configfs[f'configs/c.1/{name}'] = SymLink(self.configfs[f'functions/{name}'].path)
+            self.configfs[f'functions/{name}'] = {
+                'protocol': f'{function.PROTOCOL}',
+                'subclass': f'{function.SUBCLASS}',
+                'report_length': f'{function.DESCRIPTOR.input_len}',
+                'report_desc': function.DESCRIPTOR
+            }
+            self.configfs[f'configs/c.1/{name}'] = SymLink(self.configfs[f'functions/{name}'].path)
+            self._adopt_function(function)
 
-        dev = self.configfs[f'functions/{name}/dev']
+    def _adopt_function(self, function: HIDDevice) -> None:
+        dev = self.configfs[f'functions/hid.{function.name}/dev']
         if not isinstance(dev, str):
             raise TypeError
         function.dev = f"/dev/hidg{dev.split(':')[1].strip()}"
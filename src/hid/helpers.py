@@ -4,6 +4,8 @@ from collections.abc import Iterable, MutableMapping, Iterator, Mapping
 from dataclasses import dataclass
 from typing import SupportsIndex, Any, Union, Type, TypeVar, Optional
 
+from hid import trace
+
 _KT = str
 _VT = Union[str, bytes, 'SymLink', 'Directory']
 _GT = Mapping[_KT, Union[_VT, '_GT']]  # type: ignore
@@ -64,6 +66,8 @@ class Directory(MutableMapping[_KT, _VT]):
                 del self[k]
             os.makedirs(os.path.dirname(p), exist_ok=True)
             m = 't' if isinstance(v, str) else 'b'
+            if trace.enabled:
+                trace.instant('configfs write', path=p)
             with open(p, f'w{m}') as f:
                 f.write(v)
         elif isinstance(v, SymLink):
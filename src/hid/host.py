@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import os
+import select
+from types import TracebackType
+from typing import Literal, Optional, Type
+
+from typing_extensions import Self
+
+from hid.report import ReportDescriptor, ReportDecoder
+
+SYSFS_PATH = '/sys/class/hidraw'
+DEV_PATH = '/dev'
+
+
+class HIDRawDevice:
+    def __init__(self, name: str, sysfs: str = SYSFS_PATH, dev: str = DEV_PATH) -> None:
+        self.name = name
+        self.path = os.path.join(dev, name)
+        device = os.path.join(sysfs, name, 'device')
+
+        with open(os.path.join(device, 'report_descriptor'), 'rb') as f:
+            self.descriptor = ReportDescriptor(f.read())
+        self.decoder = ReportDecoder(self.descriptor.layout)
+
+        self.uevent: dict[str, str] = {}
+        try:
+            with open(os.path.join(device, 'uevent'), 'rt') as f:
+                for line in f:
+                    k, _, v = line.rstrip('\n').partition('=')
+                    self.uevent[k] = v
+        except FileNotFoundError:
+            pass
+
+        self._fd: Optional[int] = None
+        # hidraw returns one report per read, truncated to the requested size
+        self._buffer = bytearray(max(self.descriptor.input_len, 1))
+        self._poller = select.poll()
+
+    def __enter__(self) -> Self:
+        self.open()
+        return self
+
+    def __exit__(self,
+                 exc_type: Optional[Type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> Literal[False]:
+        self.close()
+        return False
+
+    @property
+    def vendor_id(self) -> Optional[int]:
+        # HID_ID=<bus>:<vendor>:<product>
+        hid_id = self.uevent.get('HID_ID')
+        return int(hid_id.split(':')[1], 16) if hid_id else None
+
+    @property
+    def product_id(self) -> Optional[int]:
+        hid_id = self.uevent.get('HID_ID')
+        return int(hid_id.split(':')[2], 16) if hid_id else None
+
+    def open(self) -> None:
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+            self._poller.register(self._fd, select.POLLIN)
+
+    def close(self) -> None:
+        if self._fd is not None:
+            self._poller.unregister(self._fd)
+            os.close(self._fd)
+            self._fd = None
+
+    def fileno(self) -> int:
+        self.open()
+        assert self._fd is not None
+        return self._fd
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        self.open()
+        return bool(self._poller.poll(None if timeout is None else timeout * 1000))
+
+    def _read(self) -> int:
+        try:
+            return os.readv(self.fileno(), [self._buffer])
+        except BlockingIOError:
+            return 0
+
+    def read_reports(self, limit: int = 64) -> list[bytes]:
+        reports: list[bytes] = []
+        while len(reports) < limit:
+            n = self._read()
+            if not n:
+                break
+            reports.append(bytes(self._buffer[:n]))
+        return reports
+
+    def read_events(self, limit: int = 64) -> list[list[tuple[int, int]]]:
+        decode = self.decoder.decode
+        events: list[list[tuple[int, int]]] = []
+        with memoryview(self._buffer) as buffer:
+            while len(events) < limit:
+                n = self._read()
+                if not n:
+                    break
+                events.append(decode(buffer[:n]))
+        return events
+
+
+def enumerate_devices(sysfs: str = SYSFS_PATH, dev: str = DEV_PATH) -> list[HIDRawDevice]:
+    try:
+        names = os.listdir(sysfs)
+    except FileNotFoundError:
+        return []
+    return [HIDRawDevice(name, sysfs, dev) for name in sorted(names, key=lambda n: (len(n), n))]
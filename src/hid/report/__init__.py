@@ -4,7 +4,11 @@ from __future__ import annotations
 from typing import Union, Generator
 
 from hid.helpers import flatten
+from . import cache
+from .decoder import ReportDecoder
 from .item import *
+from .layout import ReportField, compile_layout, optimize, report_length
+from .pretty import describe
 
 _DT = Iterable[Union[BaseItem, '_DT']]  # type: ignore
 
@@ -15,45 +19,47 @@ class ReportDescriptor(bytes):
         return super().__new__(cls, b)
 
     def __init__(self, descriptor: Union[bytes, _DT]) -> None:
-        global_items: dict[int, int] = {}
-        local_items: dict[int, int] = {}
-        input_items = []
-        output_items = []
+        self._item_offsets: Optional[tuple[int, ...]] = None
+        data = bytes(self)
+        compiled = cache.load(data)
+        if compiled is None:
+            items = list(self.items())
+            offsets = [0]
+            for x in items[:-1]:
+                offsets.append(offsets[-1] + len(x))
+            layout = compile_layout(items)
+            compiled = cache.CompiledDescriptor(data=data,
+                                                item_offsets=tuple(offsets) if items else (),
+                                                input_len=report_length(layout, Input),
+                                                output_len=report_length(layout, Output),
+                                                layout=layout)
+            cache.store(compiled)
 
-        for x in self.items():
-            if not isinstance(x, BaseItem):
-                raise TypeError
-
-            if x.size == 0:
-                continue
-            data = int.from_bytes(x.data, 'little')
-            if isinstance(x, BaseMainItem):
-                if isinstance(x, Input):
-                    input_items.append(global_items | local_items)
-                elif isinstance(x, Output):
-                    output_items.append(global_items | local_items)
-                local_items.clear()
-            elif isinstance(x, BaseGlobalItem):
-                global_items[x.PREFIX] = data
-            elif isinstance(x, BaseLocalItem):
-                local_items[x.PREFIX] = data
-
-        input_bit_len = 0
-        for y in input_items:
-            input_bit_len += y[ReportSize.PREFIX] * y[ReportCount.PREFIX]
-        self.input_len = ceil(input_bit_len / 8)
-        output_bit_len = 0
-        for y in output_items:
-            output_bit_len += y[ReportSize.PREFIX] * y[ReportCount.PREFIX]
-        self.output_len = ceil(output_bit_len / 8)
+        self._item_offsets = compiled.item_offsets
+        self.layout = compiled.layout
+        self.input_len = compiled.input_len
+        self.output_len = compiled.output_len
 
     def items(self) -> Generator[BaseItem, None, None]:
+        if self._item_offsets is not None:
+            for i in self._item_offsets:
+                yield BaseItem.from_bytes(self[i:])
+            return
         i = 0
         while i < len(self):
             x = BaseItem.from_bytes(self[i:])
             yield x
             i += len(x)
 
+    def optimize(self) -> ReportDescriptor:
+        optimized = ReportDescriptor(optimize(self.items()))
+        if optimized.layout != self.layout:
+            raise ValueError('Optimized descriptor is not equivalent to the original.')
+        return optimized
+
+    def describe(self) -> str:
+        return '\n'.join(describe(self.items()))
+
     def validate_input_report(self, report: SupportsBytes | Iterable[SupportsIndex]) -> bool:
         report = bytes(report)
         if not len(report) == self.input_len:
@@ -0,0 +1,1239 @@
+# Transcribed by hand from the HID Usage Tables. Usages are only listed for the pages
+# up to Digitizers and for the numbered pages; the other pages have their names
+# only. `python tools/usage_tables.py HidUsageTables.json` replaces this file with
+# tables generated from the complete JSON edition.
+#
+# PAGES maps a usage page ID to (name, usages). For most pages, usages is a string
+# of "ID Name" lines with 4 digit hex IDs, sorted by ID, which hid.report.usage
+# parses into a table the first time the page is looked up. Pages whose usages are
+# numbered instead of named (Button, Ordinal, ...) store (prefix, first, last, name
+# of usage 0) instead.
+
+from __future__ import annotations
+
+from typing import Optional, Union
+
+PAGES: dict[int, tuple[str, Union[str, tuple[str, int, int, Optional[str]]]]] = {
+    0x0001: ('Generic Desktop', """\
+0001 Pointer
+0002 Mouse
+0004 Joystick
+0005 Gamepad
+0006 Keyboard
+0007 Keypad
+0008 Multi-axis Controller
+0009 Tablet PC System Controls
+000A Water Cooling Device
+000B Computer Chassis Device
+000C Wireless Radio Controls
+000D Portable Device Control
+000E System Multi-Axis Controller
+000F Spatial Controller
+0010 Assistive Control
+0011 Device Dock
+0012 Dockable Device
+0013 Call State Management Control
+0030 X
+0031 Y
+0032 Z
+0033 Rx
+0034 Ry
+0035 Rz
+0036 Slider
+0037 Dial
+0038 Wheel
+0039 Hat Switch
+003A Counted Buffer
+003B Byte Count
+003C Motion Wakeup
+003D Start
+003E Select
+0040 Vx
+0041 Vy
+0042 Vz
+0043 Vbrx
+0044 Vbry
+0045 Vbrz
+0046 Vno
+0047 Feature Notification
+0048 Resolution Multiplier
+0049 Qx
+004A Qy
+004B Qz
+004C Qw
+0080 System Control
+0081 System Power Down
+0082 System Sleep
+0083 System Wake Up
+0084 System Context Menu
+0085 System Main Menu
+0086 System App Menu
+0087 System Menu Help
+0088 System Menu Exit
+0089 System Menu Select
+008A System Menu Right
+008B System Menu Left
+008C System Menu Up
+008D System Menu Down
+008E System Cold Restart
+008F System Warm Restart
+0090 D-pad Up
+0091 D-pad Down
+0092 D-pad Right
+0093 D-pad Left
+0094 Index Trigger
+0095 Palm Trigger
+0096 Thumbstick
+0097 System Function Shift
+0098 System Function Shift Lock
+0099 System Function Shift Lock Indicator
+009A System Dismiss Notification
+009B System Do Not Disturb
+00A0 System Dock
+00A1 System Undock
+00A2 System Setup
+00A3 System Break
+00A4 System Debugger Break
+00A5 Application Break
+00A6 Application Debugger Break
+00A7 System Speaker Mute
+00A8 System Hibernate
+00A9 System Microphone Mute
+00B0 System Display Invert
+00B1 System Display Internal
+00B2 System Display External
+00B3 System Display Both
+00B4 System Display Dual
+00B5 System Display Toggle Int/Ext Mode
+00B6 System Display Swap Primary/Secondary
+00B7 System Display Toggle LCD Autoscale
+00C0 Sensor Zone
+00C1 RPM
+00C2 Coolant Level
+00C3 Coolant Critical Level
+00C4 Coolant Pump
+00C5 Chassis Enclosure
+00C6 Wireless Radio Button
+00C7 Wireless Radio LED
+00C8 Wireless Radio Slider Switch
+00C9 System Display Rotation Lock Button
+00CA System Display Rotation Lock Slider Switch
+00CB Control Enable
+00D0 Dockable Device Unique ID
+00D1 Dockable Device Vendor ID
+00D2 Dockable Device Primary Usage Page
+00D3 Dockable Device Primary Usage ID
+00D4 Dockable Device Docking State
+00D5 Dockable Device Display Occlusion
+00D6 Dockable Device Object Type
+00E0 Call Active LED
+00E1 Call Mute Toggle
+00E2 Call Mute LED
+"""),
+    0x0002: ('Simulation Controls', """\
+0001 Flight Simulation Device
+0002 Automobile Simulation Device
+0003 Tank Simulation Device
+0004 Spaceship Simulation Device
+0005 Submarine Simulation Device
+0006 Sailing Simulation Device
+0007 Motorcycle Simulation Device
+0008 Sports Simulation Device
+0009 Airplane Simulation Device
+000A Helicopter Simulation Device
+000B Magic Carpet Simulation Device
+000C Bicycle Simulation Device
+0020 Flight Control Stick
+0021 Flight Stick
+0022 Cyclic Control
+0023 Cyclic Trim
+0024 Flight Yoke
+0025 Track Control
+00B0 Aileron
+00B1 Aileron Trim
+00B2 Anti-Torque Control
+00B3 Autopilot Enable
+00B4 Chaff Release
+00B5 Collective Control
+00B6 Dive Brake
+00B7 Electronic Countermeasures
+00B8 Elevator
+00B9 Elevator Trim
+00BA Rudder
+00BB Throttle
+00BC Flight Communications
+00BD Flare Release
+00BE Landing Gear
+00BF Toe Brake
+00C0 Trigger
+00C1 Weapons Arm
+00C2 Weapons Select
+00C3 Wing Flaps
+00C4 Accelerator
+00C5 Brake
+00C6 Clutch
+00C7 Shifter
+00C8 Steering
+00C9 Turret Direction
+00CA Barrel Elevation
+00CB Dive Plane
+00CC Ballast
+00CD Bicycle Crank
+00CE Handle Bars
+00CF Front Brake
+00D0 Rear Brake
+"""),
+    0x0003: ('VR Controls', """\
+0001 Belt
+0002 Body Suit
+0003 Flexor
+0004 Glove
+0005 Head Tracker
+0006 Head Mounted Display
+0007 Hand Tracker
+0008 Oculometer
+0009 Vest
+000A Animatronic Device
+0020 Stereo Enable
+0021 Display Enable
+"""),
+    0x0004: ('Sport Controls', """\
+0001 Baseball Bat
+0002 Golf Club
+0003 Rowing Machine
+0004 Treadmill
+0030 Oar
+0031 Slope
+0032 Rate
+0033 Stick Speed
+0034 Stick Face Angle
+0035 Stick Heel/Toe
+0036 Stick Follow Through
+0037 Stick Tempo
+0038 Stick Type
+0039 Stick Height
+0050 Putter
+0051 1 Iron
+0052 2 Iron
+0053 3 Iron
+0054 4 Iron
+0055 5 Iron
+0056 6 Iron
+0057 7 Iron
+0058 8 Iron
+0059 9 Iron
+005A 10 Iron
+005B 11 Iron
+005C Sand Wedge
+005D Loft Wedge
+005E Power Wedge
+005F 1 Wood
+0060 3 Wood
+0061 5 Wood
+0062 7 Wood
+0063 9 Wood
+"""),
+    0x0005: ('Game Controls', """\
+0001 3D Game Controller
+0002 Pinball Device
+0003 Gun Device
+0020 Point of View
+0021 Turn Right/Left
+0022 Pitch Forward/Backward
+0023 Roll Right/Left
+0024 Move Right/Left
+0025 Move Forward/Backward
+0026 Move Up/Down
+0027 Lean Right/Left
+0028 Lean Forward/Backward
+0029 Height of POV
+002A Flipper
+002B Secondary Flipper
+002C Bump
+002D New Game
+002E Shoot Ball
+002F Player
+0030 Gun Bolt
+0031 Gun Clip
+0032 Gun Selector
+0033 Gun Single Shot
+0034 Gun Burst
+0035 Gun Automatic
+0036 Gun Safety
+0037 Gamepad Fire/Jump
+0039 Gamepad Trigger
+003A Form-fitting Gamepad
+"""),
+    0x0006: ('Generic Device Controls', """\
+0001 Background/Nonuser Controls
+0020 Battery Strength
+0021 Wireless Channel
+0022 Wireless ID
+0023 Discover Wireless Control
+0024 Security Code Character Entered
+0025 Security Code Character Erased
+0026 Security Code Cleared
+0027 Sequence ID
+0028 Sequence ID Reset
+0029 RF Signal Strength
+002A Software Version
+002B Protocol Version
+002C Hardware Version
+002D Major
+002E Minor
+002F Revision
+0030 Handedness
+0031 Either Hand
+0032 Left Hand
+0033 Right Hand
+0034 Both Hands
+0040 Grip Pose Offset
+0041 Pointer Pose Offset
+"""),
+    0x0007: ('Keyboard/Keypad', """\
+0000 Reserved
+0001 Keyboard ErrorRollOver
+0002 Keyboard POSTFail
+0003 Keyboard ErrorUndefined
+0004 Keyboard a and A
+0005 Keyboard b and B
+0006 Keyboard c and C
+0007 Keyboard d and D
+0008 Keyboard e and E
+0009 Keyboard f and F
+000A Keyboard g and G
+000B Keyboard h and H
+000C Keyboard i and I
+000D Keyboard j and J
+000E Keyboard k and K
+000F Keyboard l and L
+0010 Keyboard m and M
+0011 Keyboard n and N
+0012 Keyboard o and O
+0013 Keyboard p and P
+0014 Keyboard q and Q
+0015 Keyboard r and R
+0016 Keyboard s and S
+0017 Keyboard t and T
+0018 Keyboard u and U
+0019 Keyboard v and V
+001A Keyboard w and W
+001B Keyboard x and X
+001C Keyboard y and Y
+001D Keyboard z and Z
+001E Keyboard 1 and !
+001F Keyboard 2 and @
+0020 Keyboard 3 and #
+0021 Keyboard 4 and $
+0022 Keyboard 5 and %
+0023 Keyboard 6 and ^
+0024 Keyboard 7 and &
+0025 Keyboard 8 and *
+0026 Keyboard 9 and (
+0027 Keyboard 0 and )
+0028 Keyboard Return (ENTER)
+0029 Keyboard ESCAPE
+002A Keyboard DELETE (Backspace)
+002B Keyboard Tab
+002C Keyboard Spacebar
+002D Keyboard - and (underscore)
+002E Keyboard = and +
+002F Keyboard [ and {
+0030 Keyboard ] and }
+0031 Keyboard \\ and |
+0032 Keyboard Non-US # and ~
+0033 Keyboard ; and :
+0034 Keyboard ' and "
+0035 Keyboard Grave Accent and Tilde
+0036 Keyboard , and <
+0037 Keyboard . and >
+0038 Keyboard / and ?
+0039 Keyboard Caps Lock
+003A Keyboard F1
+003B Keyboard F2
+003C Keyboard F3
+003D Keyboard F4
+003E Keyboard F5
+003F Keyboard F6
+0040 Keyboard F7
+0041 Keyboard F8
+0042 Keyboard F9
+0043 Keyboard F10
+0044 Keyboard F11
+0045 Keyboard F12
+0046 Keyboard PrintScreen
+0047 Keyboard Scroll Lock
+0048 Keyboard Pause
+0049 Keyboard Insert
+004A Keyboard Home
+004B Keyboard PageUp
+004C Keyboard Delete Forward
+004D Keyboard End
+004E Keyboard PageDown
+004F Keyboard RightArrow
+0050 Keyboard LeftArrow
+0051 Keyboard DownArrow
+0052 Keyboard UpArrow
+0053 Keypad Num Lock and Clear
+0054 Keypad /
+0055 Keypad *
+0056 Keypad -
+0057 Keypad +
+0058 Keypad ENTER
+0059 Keypad 1 and End
+005A Keypad 2 and Down Arrow
+005B Keypad 3 and PageDn
+005C Keypad 4 and Left Arrow
+005D Keypad 5
+005E Keypad 6 and Right Arrow
+005F Keypad 7 and Home
+0060 Keypad 8 and Up Arrow
+0061 Keypad 9 and PageUp
+0062 Keypad 0 and Insert
+0063 Keypad . and Delete
+0064 Keyboard Non-US \\ and |
+0065 Keyboard Application
+0066 Keyboard Power
+0067 Keypad =
+0068 Keyboard F13
+0069 Keyboard F14
+006A Keyboard F15
+006B Keyboard F16
+006C Keyboard F17
+006D Keyboard F18
+006E Keyboard F19
+006F Keyboard F20
+0070 Keyboard F21
+0071 Keyboard F22
+0072 Keyboard F23
+0073 Keyboard F24
+0074 Keyboard Execute
+0075 Keyboard Help
+0076 Keyboard Menu
+0077 Keyboard Select
+0078 Keyboard Stop
+0079 Keyboard Again
+007A Keyboard Undo
+007B Keyboard Cut
+007C Keyboard Copy
+007D Keyboard Paste
+007E Keyboard Find
+007F Keyboard Mute
+0080 Keyboard Volume Up
+0081 Keyboard Volume Down
+0082 Keyboard Locking Caps Lock
+0083 Keyboard Locking Num Lock
+0084 Keyboard Locking Scroll Lock
+0085 Keypad Comma
+0086 Keypad Equal Sign
+0087 Keyboard International1
+0088 Keyboard International2
+0089 Keyboard International3
+008A Keyboard International4
+008B Keyboard International5
+008C Keyboard International6
+008D Keyboard International7
+008E Keyboard International8
+008F Keyboard International9
+0090 Keyboard LANG1
+0091 Keyboard LANG2
+0092 Keyboard LANG3
+0093 Keyboard LANG4
+0094 Keyboard LANG5
+0095 Keyboard LANG6
+0096 Keyboard LANG7
+0097 Keyboard LANG8
+0098 Keyboard LANG9
+0099 Keyboard Alternate Erase
+009A Keyboard SysReq/Attention
+009B Keyboard Cancel
+009C Keyboard Clear
+009D Keyboard Prior
+009E Keyboard Return
+009F Keyboard Separator
+00A0 Keyboard Out
+00A1 Keyboard Oper
+00A2 Keyboard Clear/Again
+00A3 Keyboard CrSel/Props
+00A4 Keyboard ExSel
+00B0 Keypad 00
+00B1 Keypad 000
+00B2 Thousands Separator
+00B3 Decimal Separator
+00B4 Currency Unit
+00B5 Currency Sub-unit
+00B6 Keypad (
+00B7 Keypad )
+00B8 Keypad {
+00B9 Keypad }
+00BA Keypad Tab
+00BB Keypad Backspace
+00BC Keypad A
+00BD Keypad B
+00BE Keypad C
+00BF Keypad D
+00C0 Keypad E
+00C1 Keypad F
+00C2 Keypad XOR
+00C3 Keypad ^
+00C4 Keypad %
+00C5 Keypad <
+00C6 Keypad >
+00C7 Keypad &
+00C8 Keypad &&
+00C9 Keypad |
+00CA Keypad ||
+00CB Keypad :
+00CC Keypad #
+00CD Keypad Space
+00CE Keypad @
+00CF Keypad !
+00D0 Keypad Memory Store
+00D1 Keypad Memory Recall
+00D2 Keypad Memory Clear
+00D3 Keypad Memory Add
+00D4 Keypad Memory Subtract
+00D5 Keypad Memory Multiply
+00D6 Keypad Memory Divide
+00D7 Keypad +/-
+00D8 Keypad Clear
+00D9 Keypad Clear Entry
+00DA Keypad Binary
+00DB Keypad Octal
+00DC Keypad Decimal
+00DD Keypad Hexadecimal
+00E0 Keyboard LeftControl
+00E1 Keyboard LeftShift
+00E2 Keyboard LeftAlt
+00E3 Keyboard Left GUI
+00E4 Keyboard RightControl
+00E5 Keyboard RightShift
+00E6 Keyboard RightAlt
+00E7 Keyboard Right GUI
+"""),
+    0x0008: ('LED', """\
+0001 Num Lock
+0002 Caps Lock
+0003 Scroll Lock
+0004 Compose
+0005 Kana
+0006 Power
+0007 Shift
+0008 Do Not Disturb
+0009 Mute
+000A Tone Enable
+000B High Cut Filter
+000C Low Cut Filter
+000D Equalizer Enable
+000E Sound Field On
+000F Surround On
+0010 Repeat
+0011 Stereo
+0012 Sampling Rate Detect
+0013 Spinning
+0014 CAV
+0015 CLV
+0016 Recording Format Detect
+0017 Off-Hook
+0018 Ring
+0019 Message Waiting
+001A Data Mode
+001B Battery Operation
+001C Battery OK
+001D Battery Low
+001E Speaker
+001F Headset
+0020 Hold
+0021 Microphone
+0022 Coverage
+0023 Night Mode
+0024 Send Calls
+0025 Call Pickup
+0026 Conference
+0027 Stand-by
+0028 Camera On
+0029 Camera Off
+002A On-Line
+002B Off-Line
+002C Busy
+002D Ready
+002E Paper-Out
+002F Paper-Jam
+0030 Remote
+0031 Forward
+0032 Reverse
+0033 Stop
+0034 Rewind
+0035 Fast Forward
+0036 Play
+0037 Pause
+0038 Record
+0039 Error
+003A Usage Selected Indicator
+003B Usage In Use Indicator
+003C Usage Multi Mode Indicator
+003D Indicator On
+003E Indicator Flash
+003F Indicator Slow Blink
+0040 Indicator Fast Blink
+0041 Indicator Off
+0042 Flash On Time
+0043 Slow Blink On Time
+0044 Slow Blink Off Time
+0045 Fast Blink On Time
+0046 Fast Blink Off Time
+0047 Usage Indicator Color
+0048 Indicator Red
+0049 Indicator Green
+004A Indicator Amber
+004B Generic Indicator
+004C System Suspend
+004D External Power Connected
+"""),
+    0x0009: ('Button', ('Button', 1, 65535, 'No Button Pressed')),
+    0x000A: ('Ordinal', ('Instance', 1, 65535, None)),
+    0x000B: ('Telephony Device', """\
+0001 Phone
+0002 Answering Machine
+0003 Message Controls
+0004 Handset
+0005 Headset
+0006 Telephony Key Pad
+0007 Programmable Button
+0020 Hook Switch
+0021 Flash
+0022 Feature
+0023 Hold
+0024 Redial
+0025 Transfer
+0026 Drop
+0027 Park
+0028 Forward Calls
+0029 Alternate Function
+002A Line
+002B Speaker Phone
+002C Conference
+002D Ring Enable
+002E Ring Select
+002F Phone Mute
+0030 Caller ID
+0031 Send
+0050 Speed Dial
+0051 Store Number
+0052 Recall Number
+0053 Phone Directory
+0070 Voice Mail
+0071 Screen Calls
+0072 Do Not Disturb
+0073 Message
+0074 Answer On/Off
+0090 Inside Dial Tone
+0091 Outside Dial Tone
+0092 Inside Ring Tone
+0093 Outside Ring Tone
+0094 Priority Ring Tone
+0095 Inside Ringback
+0096 Priority Ringback
+0097 Line Busy Tone
+0098 Reorder Tone
+0099 Call Waiting Tone
+009A Confirmation Tone 1
+009B Confirmation Tone 2
+009C Tones Off
+009D Outside Ringback
+009E Ringer
+00B0 Phone Key 0
+00B1 Phone Key 1
+00B2 Phone Key 2
+00B3 Phone Key 3
+00B4 Phone Key 4
+00B5 Phone Key 5
+00B6 Phone Key 6
+00B7 Phone Key 7
+00B8 Phone Key 8
+00B9 Phone Key 9
+00BA Phone Key Star
+00BB Phone Key Pound
+00BC Phone Key A
+00BD Phone Key B
+00BE Phone Key C
+00BF Phone Key D
+"""),
+    0x000C: ('Consumer', """\
+0001 Consumer Control
+0002 Numeric Key Pad
+0003 Programmable Buttons
+0004 Microphone
+0005 Headphone
+0006 Graphic Equalizer
+0020 +10
+0021 +100
+0022 AM/PM
+0030 Power
+0031 Reset
+0032 Sleep
+0033 Sleep After
+0034 Sleep Mode
+0035 Illumination
+0036 Function Buttons
+0040 Menu
+0041 Menu Pick
+0042 Menu Up
+0043 Menu Down
+0044 Menu Left
+0045 Menu Right
+0046 Menu Escape
+0047 Menu Value Increase
+0048 Menu Value Decrease
+0060 Data On Screen
+0061 Closed Caption
+0062 Closed Caption Select
+0063 VCR/TV
+0064 Broadcast Mode
+0065 Snapshot
+0066 Still
+0067 Picture-in-Picture Toggle
+0068 Picture-in-Picture Swap
+0069 Red Menu Button
+006A Green Menu Button
+006B Blue Menu Button
+006C Yellow Menu Button
+006D Aspect
+006E 3D Mode Select
+006F Display Brightness Increment
+0070 Display Brightness Decrement
+0071 Display Brightness
+0072 Display Backlight Toggle
+0073 Display Set Brightness to Minimum
+0074 Display Set Brightness to Maximum
+0075 Display Set Auto Brightness
+0076 Camera Access Enabled
+0077 Camera Access Disabled
+0078 Camera Access Toggle
+0079 Keyboard Brightness Increment
+007A Keyboard Brightness Decrement
+007B Keyboard Backlight Set Level
+007C Keyboard Backlight OOC
+007D Keyboard Backlight Set Minimum
+007E Keyboard Backlight Set Maximum
+007F Keyboard Backlight Auto
+0080 Selection
+0081 Assign Selection
+0082 Mode Step
+0083 Recall Last
+0084 Enter Channel
+0085 Order Movie
+0086 Channel
+0087 Media Selection
+0088 Media Select Computer
+0089 Media Select TV
+008A Media Select WWW
+008B Media Select DVD
+008C Media Select Telephone
+008D Media Select Program Guide
+008E Media Select Video Phone
+008F Media Select Games
+0090 Media Select Messages
+0091 Media Select CD
+0092 Media Select VCR
+0093 Media Select Tuner
+0094 Quit
+0095 Help
+0096 Media Select Tape
+0097 Media Select Cable
+0098 Media Select Satellite
+0099 Media Select Security
+009A Media Select Home
+009B Media Select Call
+009C Channel Increment
+009D Channel Decrement
+009E Media Select SAP
+00A0 VCR Plus
+00A1 Once
+00A2 Daily
+00A3 Weekly
+00A4 Monthly
+00B0 Play
+00B1 Pause
+00B2 Record
+00B3 Fast Forward
+00B4 Rewind
+00B5 Scan Next Track
+00B6 Scan Previous Track
+00B7 Stop
+00B8 Eject
+00B9 Random Play
+00BA Select Disc
+00BB Enter Disc
+00BC Repeat
+00BD Tracking
+00BE Track Normal
+00BF Slow Tracking
+00C0 Frame Forward
+00C1 Frame Back
+00C2 Mark
+00C3 Clear Mark
+00C4 Repeat From Mark
+00C5 Return To Mark
+00C6 Search Mark Forward
+00C7 Search Mark Backwards
+00C8 Counter Reset
+00C9 Show Counter
+00CA Tracking Increment
+00CB Tracking Decrement
+00CC Stop/Eject
+00CD Play/Pause
+00CE Play/Skip
+00CF Voice Command
+00D0 Invoke Capture Interface
+00D1 Start or Stop Game Recording
+00D2 Historical Game Capture
+00D3 Capture Game Screenshot
+00D4 Show or Hide Recording Indicator
+00D5 Start or Stop Microphone Capture
+00D6 Start or Stop Camera Capture
+00D7 Start or Stop Game Broadcast
+00D8 Start or Stop Voice Dictation Session
+00D9 Invoke/Dismiss Emoji Picker
+00E0 Volume
+00E1 Balance
+00E2 Mute
+00E3 Bass
+00E4 Treble
+00E5 Bass Boost
+00E6 Surround Mode
+00E7 Loudness
+00E8 MPX
+00E9 Volume Increment
+00EA Volume Decrement
+00F0 Speed Select
+00F1 Playback Speed
+00F2 Standard Play
+00F3 Long Play
+00F4 Extended Play
+00F5 Slow
+0100 Fan Enable
+0101 Fan Speed
+0102 Light Enable
+0103 Light Illumination Level
+0104 Climate Control Enable
+0105 Room Temperature
+0106 Security Enable
+0107 Fire Alarm
+0108 Police Alarm
+0109 Proximity
+010A Motion
+010B Duress Alarm
+010C Holdup Alarm
+010D Medical Alarm
+0150 Balance Right
+0151 Balance Left
+0152 Bass Increment
+0153 Bass Decrement
+0154 Treble Increment
+0155 Treble Decrement
+0160 Speaker System
+0161 Channel Left
+0162 Channel Right
+0163 Channel Center
+0164 Channel Front
+0165 Channel Center Front
+0166 Channel Side
+0167 Channel Surround
+0168 Channel Low Frequency Enhancement
+0169 Channel Top
+016A Channel Unknown
+0170 Sub-channel
+0171 Sub-channel Increment
+0172 Sub-channel Decrement
+0173 Alternate Audio Increment
+0174 Alternate Audio Decrement
+0180 Application Launch Buttons
+0181 AL Launch Button Configuration Tool
+0182 AL Programmable Button Configuration
+0183 AL Consumer Control Configuration
+0184 AL Word Processor
+0185 AL Text Editor
+0186 AL Spreadsheet
+0187 AL Graphics Editor
+0188 AL Presentation App
+0189 AL Database App
+018A AL Email Reader
+018B AL Newsreader
+018C AL Voicemail
+018D AL Contacts/Address Book
+018E AL Calendar/Schedule
+018F AL Task/Project Manager
+0190 AL Log/Journal/Timecard
+0191 AL Checkbook/Finance
+0192 AL Calculator
+0193 AL A/V Capture/Playback
+0194 AL Local Machine Browser
+0195 AL LAN/WAN Browser
+0196 AL Internet Browser
+0197 AL Remote Networking/ISP Connect
+0198 AL Network Conference
+0199 AL Network Chat
+019A AL Telephony/Dialer
+019B AL Logon
+019C AL Logoff
+019D AL Logon/Logoff
+019E AL Terminal Lock/Screensaver
+019F AL Control Panel
+01A0 AL Command Line Processor/Run
+01A1 AL Process/Task Manager
+01A2 AL Select Task/Application
+01A3 AL Next Task/Application
+01A4 AL Previous Task/Application
+01A5 AL Preemptive Halt Task/Application
+01A6 AL Integrated Help Center
+01A7 AL Documents
+01A8 AL Thesaurus
+01A9 AL Dictionary
+01AA AL Desktop
+01AB AL Spell Check
+01AC AL Grammar Check
+01AD AL Wireless Status
+01AE AL Keyboard Layout
+01AF AL Virus Protection
+01B0 AL Encryption
+01B1 AL Screen Saver
+01B2 AL Alarms
+01B3 AL Clock
+01B4 AL File Browser
+01B5 AL Power Status
+01B6 AL Image Browser
+01B7 AL Audio Browser
+01B8 AL Movie Browser
+01B9 AL Digital Rights Manager
+01BA AL Digital Wallet
+01BC AL Instant Messaging
+01BD AL OEM Features/ Tips/Tutorial Browser
+01BE AL OEM Help
+01BF AL Online Community
+01C0 AL Entertainment Content Browser
+01C1 AL Online Shopping Browser
+01C2 AL SmartCard Information/Help
+01C3 AL Market Monitor/Finance Browser
+01C4 AL Customized Corporate News Browser
+01C5 AL Online Activity Browser
+01C6 AL Research/Search Browser
+01C7 AL Audio Player
+01C8 AL Message Status
+01C9 AL Contact Sync
+01CA AL Navigation
+01CB AL Context-aware Desktop Assistant
+0200 Generic GUI Application Controls
+0201 AC New
+0202 AC Open
+0203 AC Close
+0204 AC Exit
+0205 AC Maximize
+0206 AC Minimize
+0207 AC Save
+0208 AC Print
+0209 AC Properties
+021A AC Undo
+021B AC Copy
+021C AC Cut
+021D AC Paste
+021E AC Select All
+021F AC Find
+0220 AC Find and Replace
+0221 AC Search
+0222 AC Go To
+0223 AC Home
+0224 AC Back
+0225 AC Forward
+0226 AC Stop
+0227 AC Refresh
+0228 AC Previous Link
+0229 AC Next Link
+022A AC Bookmarks
+022B AC History
+022C AC Subscriptions
+022D AC Zoom In
+022E AC Zoom Out
+022F AC Zoom
+0230 AC Full Screen View
+0231 AC Normal View
+0232 AC View Toggle
+0233 AC Scroll Up
+0234 AC Scroll Down
+0235 AC Scroll
+0236 AC Pan Left
+0237 AC Pan Right
+0238 AC Pan
+0239 AC New Window
+023A AC Tile Horizontally
+023B AC Tile Vertically
+023C AC Format
+023D AC Edit
+023E AC Bold
+023F AC Italics
+0240 AC Underline
+0241 AC Strikethrough
+0242 AC Subscript
+0243 AC Superscript
+0244 AC All Caps
+0245 AC Rotate
+0246 AC Resize
+0247 AC Flip Horizontal
+0248 AC Flip Vertical
+0249 AC Mirror Horizontal
+024A AC Mirror Vertical
+024B AC Font Select
+024C AC Font Color
+024D AC Font Size
+024E AC Justify Left
+024F AC Justify Center H
+0250 AC Justify Right
+0251 AC Justify Block H
+0252 AC Justify Top
+0253 AC Justify Center V
+0254 AC Justify Bottom
+0255 AC Justify Block V
+0256 AC Indent Decrease
+0257 AC Indent Increase
+0258 AC Numbered List
+0259 AC Restart Numbering
+025A AC Bulleted List
+025B AC Promote
+025C AC Demote
+025D AC Yes
+025E AC No
+025F AC Cancel
+0260 AC Catalog
+0261 AC Buy/Checkout
+0262 AC Add to Cart
+0263 AC Expand
+0264 AC Expand All
+0265 AC Collapse
+0266 AC Collapse All
+0267 AC Print Preview
+0268 AC Paste Special
+0269 AC Insert Mode
+026A AC Delete
+026B AC Lock
+026C AC Unlock
+026D AC Protect
+026E AC Unprotect
+026F AC Attach Comment
+0270 AC Delete Comment
+0271 AC View Comment
+0272 AC Select Word
+0273 AC Select Sentence
+0274 AC Select Paragraph
+0275 AC Select Column
+0276 AC Select Row
+0277 AC Select Table
+0278 AC Select Object
+0279 AC Redo/Repeat
+027A AC Sort
+027B AC Sort Ascending
+027C AC Sort Descending
+027D AC Filter
+027E AC Set Clock
+027F AC View Clock
+0280 AC Select Time Zone
+0281 AC Edit Time Zones
+0282 AC Set Alarm
+0283 AC Clear Alarm
+0284 AC Snooze Alarm
+0285 AC Reset Alarm
+0286 AC Synchronize
+0287 AC Send/Receive
+0288 AC Send To
+0289 AC Reply
+028A AC Reply All
+028B AC Forward Msg
+028C AC Send
+028D AC Attach File
+028E AC Upload
+028F AC Download (Save Target As)
+0290 AC Set Borders
+0291 AC Insert Row
+0292 AC Insert Column
+0293 AC Insert File
+0294 AC Insert Picture
+0295 AC Insert Object
+0296 AC Insert Symbol
+0297 AC Save and Close
+0298 AC Rename
+0299 AC Merge
+029A AC Split
+029B AC Distribute Horizontally
+029C AC Distribute Vertically
+029D AC Next Keyboard Layout Select
+029E AC Navigation Guidance
+029F AC Desktop Show All Windows
+02A0 AC Soft Key Left
+02A1 AC Soft Key Right
+02A2 AC Desktop Show All Applications
+02B0 AC Idle Keep Alive
+02C0 Extended Keyboard Attributes Collection
+02C1 Keyboard Form Factor
+02C2 Keyboard Key Type
+02C3 Keyboard Physical Layout
+02C4 Vendor-Specific Keyboard Physical Layout
+02C5 Keyboard IETF Language Tag Index
+02C6 Implemented Keyboard Input Assist Controls
+02C7 Keyboard Input Assist Previous
+02C8 Keyboard Input Assist Next
+02C9 Keyboard Input Assist Previous Group
+02CA Keyboard Input Assist Next Group
+02CB Keyboard Input Assist Accept
+02CC Keyboard Input Assist Cancel
+"""),
+    0x000D: ('Digitizers', """\
+0001 Digitizer
+0002 Pen
+0003 Light Pen
+0004 Touch Screen
+0005 Touch Pad
+0006 Whiteboard
+0007 Coordinate Measuring Machine
+0008 3D Digitizer
+0009 Stereo Plotter
+000A Articulated Arm
+000B Armature
+000C Multiple Point Digitizer
+000D Free Space Wand
+000E Device Configuration
+000F Capacitive Heat Map Digitizer
+0020 Stylus
+0021 Puck
+0022 Finger
+0023 Device Settings
+0024 Character Gesture
+0030 Tip Pressure
+0031 Barrel Pressure
+0032 In Range
+0033 Touch
+0034 Untouch
+0035 Tap
+0036 Quality
+0037 Data Valid
+0038 Transducer Index
+0039 Tablet Function Keys
+003A Program Change Keys
+003B Battery Strength
+003C Invert
+003D X Tilt
+003E Y Tilt
+003F Azimuth
+0040 Altitude
+0041 Twist
+0042 Tip Switch
+0043 Secondary Tip Switch
+0044 Barrel Switch
+0045 Eraser
+0046 Tablet Pick
+0047 Touch Valid
+0048 Width
+0049 Height
+0051 Contact Identifier
+0052 Device Mode
+0053 Device Identifier
+0054 Contact Count
+0055 Contact Count Maximum
+0056 Scan Time
+0057 Surface Switch
+0058 Button Switch
+0059 Pad Type
+005A Secondary Barrel Switch
+005B Transducer Serial Number
+005C Preferred Color
+005D Preferred Color is Locked
+005E Preferred Line Width
+005F Preferred Line Width is Locked
+0060 Latency Mode
+0061 Gesture Character Quality
+0062 Character Gesture Data Length
+0063 Character Gesture Data
+0064 Gesture Character Encoding
+0065 UTF8 Character Gesture Encoding
+0066 UTF16 Little Endian Character Gesture Encoding
+0067 UTF16 Big Endian Character Gesture Encoding
+0068 UTF32 Little Endian Character Gesture Encoding
+0069 UTF32 Big Endian Character Gesture Encoding
+006A Capacitive Heat Map Protocol Vendor ID
+006B Capacitive Heat Map Protocol Version
+006C Capacitive Heat Map Frame Data
+006D Gesture Character Enable
+006E Transducer Serial Number Part 2
+006F No Preferred Color
+0070 Preferred Line Style
+0071 Preferred Line Style is Locked
+0072 Ink
+0073 Pencil
+0074 Highlighter
+0075 Chisel Marker
+0076 Brush
+0077 No Preference
+0080 Digitizer Diagnostic
+0081 Digitizer Error
+0082 Err Normal Status
+0083 Err Transducers Exceeded
+0084 Err Full Trans Features Unavailable
+0085 Err Charge Low
+0090 Transducer Software Info
+0091 Transducer Vendor Id
+0092 Transducer Product Id
+0093 Device Supported Protocols
+0094 Transducer Supported Protocols
+0095 No Protocol
+0096 Wacom AES Protocol
+0097 USI Protocol
+0098 Microsoft Pen Protocol
+00A0 Supported Report Rates
+00A1 Report Rate
+00A2 Transducer Connected
+00A3 Switch Disabled
+00A4 Switch Unimplemented
+00A5 Transducer Switches
+"""),
+    0x000E: ('Haptics', """\
+"""),
+    0x000F: ('Physical Input Device', """\
+"""),
+    0x0010: ('Unicode', """\
+"""),
+    0x0011: ('SoC', """\
+"""),
+    0x0012: ('Eye and Head Trackers', """\
+"""),
+    0x0014: ('Auxiliary Display', """\
+"""),
+    0x0020: ('Sensors', """\
+"""),
+    0x0040: ('Medical Instrument', """\
+"""),
+    0x0041: ('Braille Display', """\
+"""),
+    0x0059: ('Lighting And Illumination', """\
+"""),
+    0x0080: ('Monitor', """\
+"""),
+    0x0081: ('Monitor Enumerated', ('ENUM', 1, 65535, None)),
+    0x0082: ('VESA Virtual Controls', """\
+"""),
+    0x0084: ('Power', """\
+"""),
+    0x0085: ('Battery System', """\
+"""),
+    0x008C: ('Barcode Scanner', """\
+"""),
+    0x008D: ('Scales', """\
+"""),
+    0x008E: ('Magnetic Stripe Reader', """\
+"""),
+    0x0090: ('Camera Control', """\
+"""),
+    0x0091: ('Arcade', """\
+"""),
+    0x0092: ('Gaming Device', """\
+"""),
+    0xF1D0: ('FIDO Alliance', """\
+"""),
+}
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import tempfile
+from dataclasses import dataclass
+
+from hid._version import __version__
+from .item import *
+from .layout import ReportField, _Layout
+
+MAGIC = b'HIDC'
+FORMAT_VERSION = 1
+
+# Caching is disabled unless a directory is configured
+directory: Optional[str] = os.environ.get('HID_CACHE_DIR') or None
+
+_KINDS: tuple[Type[BaseMainItem], ...] = (Input, Output, Feature)
+
+_HEADER = struct.Struct('<4sHB')
+_COUNTS = struct.Struct('<IHHII')
+_OFFSET = struct.Struct('<I')
+_FIELD = struct.Struct('<BHIIIIqqqqIIHH')
+_USAGE_RUN = struct.Struct('<IH')
+_COLLECTION = struct.Struct('<BI')
+
+
+@dataclass(frozen=True)
+class CompiledDescriptor:
+    data: bytes
+    item_offsets: tuple[int, ...]
+    input_len: int
+    output_len: int
+    layout: _Layout
+
+
+def _usage_runs(usages: tuple[int, ...]) -> list[tuple[int, int]]:
+    runs: list[tuple[int, int]] = []
+    for u in usages:
+        if runs and runs[-1][0] + runs[-1][1] == u and runs[-1][1] < 0xFFFF:
+            runs[-1] = (runs[-1][0], runs[-1][1] + 1)
+        else:
+            runs.append((u, 1))
+    return runs
+
+
+def dumps(compiled: CompiledDescriptor) -> bytes:
+    version = __version__.encode()
+    b = bytearray(_HEADER.pack(MAGIC, FORMAT_VERSION, len(version)))
+    b += version
+    b += _COUNTS.pack(len(compiled.data), compiled.input_len, compiled.output_len,
+                      len(compiled.item_offsets), len(compiled.layout))
+    b += compiled.data
+    for offset in compiled.item_offsets:
+        b += _OFFSET.pack(offset)
+    for f in compiled.layout:
+        runs = _usage_runs(f.usages)
+        b += _FIELD.pack(_KINDS.index(f.kind), f.report_id, f.offset, f.size, f.count, f.flags,
+                         f.logical_minimum, f.logical_maximum, f.physical_minimum, f.physical_maximum,
+                         f.unit, f.unit_exponent, len(runs), len(f.collections))
+        for start, length in runs:
+            b += _USAGE_RUN.pack(start, length)
+        for collection_type, usage in f.collections:
+            b += _COLLECTION.pack(collection_type, usage)
+    return bytes(b)
+
+
+def loads(b: bytes) -> CompiledDescriptor:
+    magic, format_version, version_len = _HEADER.unpack_from(b)
+    i = _HEADER.size
+    if magic != MAGIC or format_version != FORMAT_VERSION or b[i:i + version_len] != __version__.encode():
+        raise ValueError('Incompatible descriptor cache entry.')
+    i += version_len
+
+    data_len, input_len, output_len, n_items, n_fields = _COUNTS.unpack_from(b, i)
+    i += _COUNTS.size
+    data = bytes(b[i:i + data_len])
+    i += data_len
+    item_offsets = tuple(x for x, in _OFFSET.iter_unpack(b[i:i + n_items * _OFFSET.size]))
+    i += n_items * _OFFSET.size
+
+    layout = []
+    for _ in range(n_fields):
+        (kind, report_id, offset, size, count, flags, logical_minimum, logical_maximum,
+         physical_minimum, physical_maximum, unit, unit_exponent, n_runs, n_collections) = _FIELD.unpack_from(b, i)
+        i += _FIELD.size
+        usages: list[int] = []
+        for start, length in _USAGE_RUN.iter_unpack(b[i:i + n_runs * _USAGE_RUN.size]):
+            usages.extend(range(start, start + length))
+        i += n_runs * _USAGE_RUN.size
+        collections = tuple(_COLLECTION.iter_unpack(b[i:i + n_collections * _COLLECTION.size]))
+        i += n_collections * _COLLECTION.size
+        layout.append(ReportField(
+            kind=_KINDS[kind],
+            report_id=report_id,
+            offset=offset,
+            size=size,
+            count=count,
+            flags=flags,
+            logical_minimum=logical_minimum,
+            logical_maximum=logical_maximum,
+            physical_minimum=physical_minimum,
+            physical_maximum=physical_maximum,
+            unit=unit,
+            unit_exponent=unit_exponent,
+            usages=tuple(usages),
+            collections=collections,
+        ))
+
+    return CompiledDescriptor(data, item_offsets, input_len, output_len, tuple(layout))
+
+
+def _path(data: bytes) -> str:
+    if directory is None:
+        raise ValueError('No cache directory configured.')
+    key = hashlib.sha256(b'%s\0%d\0%s' % (__version__.encode(), FORMAT_VERSION, data)).hexdigest()
+    return os.path.join(directory, f'{key}.hidc')
+
+
+def load(data: bytes) -> Optional[CompiledDescriptor]:
+    if directory is None:
+        return None
+    try:
+        with open(_path(data), 'rb') as f:
+            compiled = loads(f.read())
+    except (OSError, ValueError, struct.error):
+        return None
+    if compiled.data != data:
+        return None
+    return compiled
+
+
+def store(compiled: CompiledDescriptor) -> None:
+    if directory is None:
+        return
+    try:
+        b = dumps(compiled)
+    except struct.error:
+        # values that don't fit the entry format (e.g. a usage page wider than 16 bits)
+        # just aren't cached
+        return
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(b)
+        # atomic, so concurrent processes never see a partial entry
+        os.replace(tmp, _path(compiled.data))
+    except OSError:
+        pass
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing_extensions import Buffer
+
+from .item import *
+from .layout import ReportField, _Layout
+from .usage import extended_usage_name
+
+_Event = tuple[int, int]
+_NamedEvent = tuple[str, int]
+# offset, size, count, mask, sign bit, usages, variable, logical minimum
+_Extractor = tuple[int, int, int, int, int, tuple[int, ...], bool, int]
+
+
+def _extractor(f: ReportField) -> _Extractor:
+    mask = (1 << f.size) - 1
+    sign_bit = 1 << (f.size - 1) if f.signed and f.size else 0
+    variable = bool(f.flags & DataFlag.VARIABLE)
+    return f.offset, f.size, f.count, mask, sign_bit, f.usages, variable, f.logical_minimum
+
+
+class ReportDecoder:
+    def __init__(self, layout: _Layout, kind: Type[BaseMainItem] = Input) -> None:
+        self.numbered = any(f.report_id for f in layout if f.kind is kind)
+        self._extractors: dict[int, list[_Extractor]] = {}
+        for f in layout:
+            # padding and fields without usages carry nothing to report
+            if f.kind is not kind or f.flags & DataFlag.CONSTANT or not f.usages:
+                continue
+            self._extractors.setdefault(f.report_id, []).append(_extractor(f))
+
+    def decode(self, report: Buffer) -> list[_Event]:
+        data = memoryview(report).cast('B')
+        report_id = 0
+        if self.numbered:
+            report_id = data[0]
+            data = data[1:]
+        value = int.from_bytes(data, 'little')
+
+        events: list[_Event] = []
+        for offset, size, count, mask, sign_bit, usages, variable, logical_minimum in self._extractors.get(report_id, ()):
+            last = len(usages) - 1
+            for i in range(count):
+                v = value >> (offset + i * size) & mask
+                if v & sign_bit:
+                    v -= sign_bit << 1
+                if variable:
+                    # a shorter usage list repeats its last usage
+                    events.append((usages[i if i < last else last], v))
+                else:
+                    # arrays hold indices into the usage list, usage ID 0 meaning nothing
+                    index = v - logical_minimum
+                    if 0 <= index <= last and usages[index] & 0xFFFF:
+                        events.append((usages[index], 1))
+        return events
+
+    def decode_named(self, report: Buffer) -> list[_NamedEvent]:
+        # usages missing from the usage tables are named by their extended usage
+        return [(extended_usage_name(usage) or f'0x{usage:08X}', value) for usage, value in self.decode(report)]
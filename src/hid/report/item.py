@@ -45,11 +45,8 @@ class BaseItem(bytes):
 
         x = bytearray([cls.PREFIX])
         if prefix_data is not None:
-            if isinstance(prefix_data, (Iterable, SupportsBytes)):
-                b = bytes(prefix_data)
-                if len(b) not in cls._SIZES:
-                    raise ValueError
-            elif isinstance(prefix_data, SupportsIndex):
+            # IntFlag members are iterable on 3.11+, so check for integers first
+            if isinstance(prefix_data, SupportsIndex):
                 n = int(prefix_data)
                 if n == 0: # bit_length() of 0 is 0
                     size = 1
@@ -59,6 +56,10 @@ class BaseItem(bytes):
                     size = ceil((n.bit_length() + int(cls.SIGNED)) / 8)
                 min_size = min([x for x in cls._SIZES if x >= size])
                 b = n.to_bytes(min_size, 'little', signed=cls.SIGNED)
+            elif isinstance(prefix_data, (Iterable, SupportsBytes)):
+                b = bytes(prefix_data)
+                if len(b) not in cls._SIZES:
+                    raise ValueError
             else:
                 raise TypeError
 
@@ -101,6 +102,10 @@ class BaseItem(bytes):
     def data(self) -> bytes:
         return bytes(self[1:1 + self.size])
 
+    @property
+    def value(self) -> int:
+        return int.from_bytes(self.data, 'little', signed=self.SIGNED)
+
 
 class BaseMainItem(BaseItem):
     pass
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .item import *
+
+_Layout = tuple['ReportField', ...]
+
+
+@dataclass(frozen=True)
+class ReportField:
+    kind: Type[BaseMainItem]
+    report_id: int
+    offset: int
+    size: int
+    count: int
+    flags: int
+    logical_minimum: int
+    logical_maximum: int
+    physical_minimum: int
+    physical_maximum: int
+    unit: int
+    unit_exponent: int
+    usages: tuple[int, ...]
+    collections: tuple[tuple[int, int], ...]
+
+    @property
+    def signed(self) -> bool:
+        return self.logical_minimum < 0
+
+
+def _extended_usage(x: BaseItem, usage_page: int) -> int:
+    # 4 byte usages already contain their page in the upper 16 bits
+    return x.value if x.size == 4 else usage_page << 16 | x.value
+
+
+def compile_layout(items: Iterable[BaseItem]) -> _Layout:
+    global_items: dict[int, BaseItem] = {}
+    stack: list[dict[int, BaseItem]] = []
+    usages: list[int] = []
+    usage_minimum: Optional[int] = None
+    collections: list[tuple[int, int]] = []
+    offsets: dict[tuple[Type[BaseMainItem], int], int] = {}
+    fields: list[ReportField] = []
+
+    def get(item: Type[BaseGlobalItem]) -> int:
+        return global_items[item.PREFIX].value if item.PREFIX in global_items else 0
+
+    for x in items:
+        if isinstance(x, Push):
+            stack.append(dict(global_items))
+        elif isinstance(x, Pop):
+            global_items = stack.pop()
+        elif isinstance(x, BaseGlobalItem):
+            global_items[x.PREFIX] = x
+        elif isinstance(x, Usage):
+            usages.append(_extended_usage(x, get(UsagePage)))
+        elif isinstance(x, UsageMinimum):
+            usage_minimum = _extended_usage(x, get(UsagePage))
+        elif isinstance(x, UsageMaximum):
+            if usage_minimum is None:
+                raise ValueError('Usage Maximum without Usage Minimum.')
+            usages.extend(range(usage_minimum, _extended_usage(x, get(UsagePage)) + 1))
+            usage_minimum = None
+        elif isinstance(x, Collection):
+            collections.append((x.value, usages[0] if usages else 0))
+        elif isinstance(x, EndCollection):
+            if not collections:
+                raise ValueError('End Collection without Collection.')
+            collections.pop()
+        elif isinstance(x, (Input, Output, Feature)):
+            logical_minimum = get(LogicalMinimum)
+            logical_maximum = get(LogicalMaximum)
+            if logical_minimum >= 0 > logical_maximum:
+                # a non-negative minimum means the maximum was meant to be unsigned
+                logical_maximum = int.from_bytes(global_items[LogicalMaximum.PREFIX].data, 'little')
+
+            report_id = get(ReportID)
+            key = (type(x), report_id)
+            offset = offsets.get(key, 0)
+            size, count = get(ReportSize), get(ReportCount)
+            offsets[key] = offset + size * count
+
+            fields.append(ReportField(
+                kind=type(x),
+                report_id=report_id,
+                offset=offset,
+                size=size,
+                count=count,
+                flags=x.value,
+                logical_minimum=logical_minimum,
+                logical_maximum=logical_maximum,
+                physical_minimum=get(PhysicalMinimum),
+                physical_maximum=get(PhysicalMaximum),
+                unit=get(Unit),
+                unit_exponent=get(UnitExponent),
+                usages=tuple(usages),
+                collections=tuple(collections),
+            ))
+
+        if isinstance(x, BaseMainItem):
+            usages.clear()
+            usage_minimum = None
+
+    return tuple(fields)
+
+
+def report_length(layout: _Layout, kind: Type[BaseMainItem]) -> int:
+    bit_lengths: dict[int, int] = {}
+    for f in layout:
+        if f.kind is kind:
+            bit_lengths[f.report_id] = max(bit_lengths.get(f.report_id, 0), f.offset + f.size * f.count)
+    # reports with an ID are prefixed by it
+    return max((ceil(n / 8) + int(i != 0) for i, n in bit_lengths.items()), default=0)
+
+
+_UNSET = object()
+
+
+def optimize(items: Iterable[BaseItem]) -> list[BaseItem]:
+    out: list[Optional[BaseItem]] = []
+    state: dict[int, int] = {}
+    stack: list[dict[int, int]] = []
+    # global items that haven't been used by a main item yet: prefix -> (index in out, previous value)
+    pending: dict[int, tuple[int, Any]] = {}
+
+    for x in items:
+        if isinstance(x, (Push, Pop)):
+            if isinstance(x, Push):
+                stack.append(dict(state))
+            else:
+                state = stack.pop()
+            pending.clear()
+        elif isinstance(x, BaseGlobalItem):
+            if x.PREFIX in pending:
+                # overwritten before anything used it
+                i, previous = pending.pop(x.PREFIX)
+                out[i] = None
+                if previous is _UNSET:
+                    del state[x.PREFIX]
+                else:
+                    state[x.PREFIX] = previous
+            if state.get(x.PREFIX, _UNSET) == x.value:
+                continue
+            pending[x.PREFIX] = (len(out), state.get(x.PREFIX, _UNSET))
+            state[x.PREFIX] = x.value
+        elif isinstance(x, (Input, Output, Feature)):
+            pending.clear()
+        elif isinstance(x, BaseLocalItem):
+            # usages are resolved against the usage page in effect when they are declared
+            pending.pop(UsagePage.PREFIX, None)
+        out.append(x)
+
+    # anything still pending trails the last main item
+    for i, _ in pending.values():
+        out[i] = None
+
+    return _collapse_usages([x for x in out if x is not None])
+
+
+def _collapse_usages(items: list[BaseItem]) -> list[BaseItem]:
+    out: list[BaseItem] = []
+    run: list[BaseItem] = []
+    # a range can't be nested inside an unterminated Usage Minimum
+    in_range = False
+
+    def flush() -> None:
+        if len(run) > 2 and not in_range:
+            replacement = [UsageMinimum(run[0].value), UsageMaximum(run[-1].value)]
+            if sum(map(len, replacement)) < sum(map(len, run)):
+                out.extend(replacement)
+                run.clear()
+                return
+        out.extend(run)
+        run.clear()
+
+    for x in items:
+        if isinstance(x, Usage) and x.size <= 2:
+            if run and x.value != run[-1].value + 1:
+                flush()
+            run.append(x)
+        else:
+            flush()
+            out.append(x)
+            if isinstance(x, UsageMinimum):
+                in_range = True
+            elif isinstance(x, (UsageMaximum, BaseMainItem)):
+                in_range = False
+    flush()
+    return out
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import re
+
+from .item import *
+from .layout import _extended_usage
+from .usage import extended_usage_name, page_name
+
+# (set, clear) names of the main item data bits, see section 6.2.2.5 of the HID spec
+_MAIN_FLAGS = (('Constant', 'Data'),
+               ('Variable', 'Array'),
+               ('Relative', 'Absolute'),
+               ('Wrap', None),
+               ('Non Linear', None),
+               ('No Preferred', None),
+               ('Null State', None),
+               ('Volatile', None),
+               ('Buffered Bytes', None))
+
+
+def _item_name(x: BaseItem) -> str:
+    return re.sub(r'(?<=[a-z])(?=[A-Z])', ' ', type(x).__name__)
+
+
+def _main_flags(x: BaseItem) -> str:
+    flags = []
+    for bit, (on, off) in enumerate(_MAIN_FLAGS):
+        # bit 7 is reserved for inputs
+        if bit == 7 and isinstance(x, Input):
+            continue
+        name = on if x.value >> bit & 1 else off
+        if name is not None:
+            flags.append(name)
+    return ', '.join(flags)
+
+
+def describe(items: Iterable[BaseItem], indent: str = '    ') -> list[str]:
+    lines = []
+    depth = 0
+    usage_page = 0
+    pushed: list[int] = []
+    for x in items:
+        argument: Optional[str] = None
+        if isinstance(x, UsagePage):
+            usage_page = x.value
+            argument = page_name(usage_page) or f'0x{usage_page:04X}'
+        elif isinstance(x, (Usage, UsageMinimum, UsageMaximum)):
+            usage = _extended_usage(x, usage_page)
+            name = extended_usage_name(usage)
+            if name is not None and x.size == 4:
+                name = f'{page_name(usage >> 16)}: {name}'
+            argument = name or f'0x{x.value:0{x.size * 2}X}'
+        elif isinstance(x, Collection):
+            try:
+                argument = CollectionType(x.value).name.replace('_', ' ').title()
+            except ValueError:
+                argument = f'Vendor-defined 0x{x.value:02X}'
+        elif isinstance(x, (Input, Output, Feature)):
+            argument = _main_flags(x)
+        elif isinstance(x, Push):
+            pushed.append(usage_page)
+        elif isinstance(x, Pop):
+            usage_page = pushed.pop() if pushed else usage_page
+        elif not isinstance(x, EndCollection):
+            argument = str(x.value)
+
+        if isinstance(x, EndCollection):
+            depth = max(depth - 1, 0)
+        lines.append(indent * depth + (_item_name(x) if argument is None else f'{_item_name(x)} ({argument})'))
+        if isinstance(x, Collection):
+            depth += 1
+    return lines
@@ -1,4 +1,10 @@
+from __future__ import annotations
+
+from array import array
 from enum import IntEnum, auto
+from typing import Iterator, Optional, Union
+
+VENDOR_DEFINED = range(0xFF00, 0x10000)
 
 
 class UsagePages(IntEnum):
@@ -57,7 +63,7 @@ class GenericDesktop(IntEnum):
     DEVICE_DOCK = auto()
     DOCKABLE_DEVICE = auto()
     CALL_STATE_MANAGEMENT_CONTROL = auto()
-    X = auto()
+    X = 0x30
     Y = auto()
     Z = auto()
     RX = auto()
@@ -75,3 +81,138 @@ class LED(IntEnum):
     NUM_LOCK = auto()
     CAPS_LOCK = auto()
     SCROLL_LOCK = auto()
+    COMPOSE = auto()
+    KANA = auto()
+
+
+class UsageTable:
+    # Usage IDs are kept in an array and names in a tuple at the same index. Both are
+    # parsed from the page's data on first lookup, along with the dicts that index them.
+    def __init__(self, page: int, name: str, data: str) -> None:
+        self.page = page
+        self.name = name
+        self._data: Optional[str] = data
+        self._ids = array('H')
+        self._names: tuple[str, ...] = ()
+        self._by_id: dict[int, int] = {}
+        self._by_name: dict[str, int] = {}
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__qualname__}(0x{self.page:04X}, {self.name!r})'
+
+    def _load(self) -> None:
+        if self._data is None:
+            return
+        lines = self._data.splitlines()
+        self._ids = array('H', (int(line[:4], 16) for line in lines))
+        self._names = tuple(line[5:] for line in lines)
+        self._by_id = {usage: i for i, usage in enumerate(self._ids)}
+        self._by_name = {name.casefold(): usage for usage, name in zip(self._ids, self._names)}
+        self._data = None
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[tuple[int, str]]:
+        self._load()
+        return zip(self._ids, self._names)
+
+    def name_of(self, usage: int) -> Optional[str]:
+        self._load()
+        i = self._by_id.get(usage)
+        return None if i is None else self._names[i]
+
+    def id_of(self, name: str) -> Optional[int]:
+        self._load()
+        return self._by_name.get(name.casefold())
+
+
+class GeneratedUsageTable(UsageTable):
+    # Button, Ordinal and similar pages number their usages ("Button 1", "Button 2", ...)
+    def __init__(self, page: int, name: str, prefix: str, first: int, last: int, zero: Optional[str]) -> None:
+        super().__init__(page, name, '')
+        self.prefix = prefix
+        self.first = first
+        self.last = last
+        self.zero = zero
+
+    def __len__(self) -> int:
+        return self.last - self.first + 1 + (self.zero is not None)
+
+    def __iter__(self) -> Iterator[tuple[int, str]]:
+        if self.zero is not None:
+            yield 0, self.zero
+        for usage in range(self.first, self.last + 1):
+            yield usage, f'{self.prefix} {usage}'
+
+    def name_of(self, usage: int) -> Optional[str]:
+        if self.first <= usage <= self.last:
+            return f'{self.prefix} {usage}'
+        if usage == 0:
+            return self.zero
+        return None
+
+    def id_of(self, name: str) -> Optional[int]:
+        if self.zero is not None and name.casefold() == self.zero.casefold():
+            return 0
+        prefix, _, number = name.rpartition(' ')
+        if prefix.casefold() != self.prefix.casefold() or not number.isdigit():
+            return None
+        usage = int(number)
+        return usage if self.first <= usage <= self.last else None
+
+
+_pages: Optional[dict[int, UsageTable]] = None
+_page_names: dict[str, int] = {}
+
+
+def _tables() -> dict[int, UsageTable]:
+    # the tables are only imported when a usage is first looked up
+    global _pages
+    if _pages is None:
+        from ._usage_tables import PAGES
+        pages: dict[int, UsageTable] = {}
+        for page, (name, usages) in PAGES.items():
+            if isinstance(usages, str):
+                pages[page] = UsageTable(page, name, usages)
+            else:
+                pages[page] = GeneratedUsageTable(page, name, *usages)
+            _page_names[name.casefold()] = page
+        _pages = pages
+    return _pages
+
+
+def usage_table(page: Union[int, str]) -> UsageTable:
+    pages = _tables()
+    if isinstance(page, str):
+        if page.casefold() not in _page_names:
+            raise KeyError(f'Unknown usage page: {page!r}')
+        page = _page_names[page.casefold()]
+    return pages[page]
+
+
+def page_name(page: int) -> Optional[str]:
+    table = _tables().get(page)
+    if table is not None:
+        return table.name
+    if page in VENDOR_DEFINED:
+        return f'Vendor-defined 0x{page:04X}'
+    return None
+
+
+def usage_name(page: int, usage: int) -> Optional[str]:
+    table = _tables().get(page)
+    return None if table is None else table.name_of(usage)
+
+
+def extended_usage_name(usage: int) -> Optional[str]:
+    return usage_name(usage >> 16, usage & 0xFFFF)
+
+
+def usage_id(page: Union[int, str], name: str) -> int:
+    table = usage_table(page)
+    usage = table.id_of(name)
+    if usage is None:
+        raise KeyError(f'Unknown usage on page {table.name!r}: {name!r}')
+    return usage
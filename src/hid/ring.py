@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from typing import Optional
+
+from typing_extensions import Buffer, Self
+
+# Single-producer/single-consumer ring of fixed-size report slots in a shared file.
+#
+# The producer only ever writes `head` and the slots, the consumer only `tail` and the
+# failure counters, so no locks are needed. Each counter is an aligned 8 byte word on its
+# own cache line, and a slot is always filled before `head` is advanced past it.
+#
+# Sequence numbers start at 1: report `seq` lives in slot `(seq - 1) % capacity` and has
+# been handled by the consumer once `tail >= seq`.
+
+MAGIC = b'HIDR'
+VERSION = 1
+
+_HEADER = struct.Struct('<4sHHI')
+_COUNTER = struct.Struct('<Q')
+_SLOT = struct.Struct('<QHH')
+_HEAD = 64
+_TAIL = 128
+_FAILED = 136
+_LAST_FAILED = 144
+_SLOTS = 192
+
+
+class Ring:
+    def __init__(self, path: str, m: mmap.mmap) -> None:
+        self.path = path
+        self._mmap = m
+        self._view = memoryview(m)
+        magic, version, self.slot_size, self.capacity = _HEADER.unpack_from(m)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"'{path}' is not a report ring.")
+        self.max_report_len = self.slot_size - _SLOT.size
+
+    @classmethod
+    def create(cls, path: str, capacity: int = 256, max_report_len: int = 64) -> Self:
+        slot_size = _SLOT.size + max_report_len
+        # 8 byte aligned slots keep the sequence numbers aligned
+        slot_size += -slot_size % 8
+        size = _SLOTS + capacity * slot_size
+
+        # build it under a temporary name so the consumer never sees a half-initialised ring
+        tmp = f'{path}.tmp'
+        fd = os.open(tmp, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.ftruncate(fd, size)
+            m = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        _HEADER.pack_into(m, 0, MAGIC, VERSION, slot_size, capacity)
+        m.flush()
+        os.replace(tmp, path)
+        return cls(path, m)
+
+    @classmethod
+    def open(cls, path: str) -> Self:
+        fd = os.open(path, os.O_RDWR)
+        try:
+            return cls(path, mmap.mmap(fd, 0))
+        finally:
+            os.close(fd)
+
+    def close(self) -> None:
+        self._view.release()
+        self._mmap.close()
+
+    def _get(self, offset: int) -> int:
+        n: int = _COUNTER.unpack_from(self._mmap, offset)[0]
+        return n
+
+    def _set(self, offset: int, n: int) -> None:
+        _COUNTER.pack_into(self._mmap, offset, n)
+
+    @property
+    def head(self) -> int:
+        return self._get(_HEAD)
+
+    @property
+    def tail(self) -> int:
+        return self._get(_TAIL)
+
+    @property
+    def failed(self) -> int:
+        return self._get(_FAILED)
+
+    @property
+    def last_failed(self) -> int:
+        return self._get(_LAST_FAILED)
+
+    def __len__(self) -> int:
+        return self.head - self.tail
+
+    # producer side
+
+    def push(self, device: int, report: Buffer) -> Optional[int]:
+        head = self._get(_HEAD)
+        if head - self._get(_TAIL) >= self.capacity:
+            return None
+        report = memoryview(report).cast('B')
+        if len(report) > self.max_report_len:
+            raise ValueError(f'Report must be at most {self.max_report_len} bytes long, not {len(report)}.')
+
+        seq = head + 1
+        offset = _SLOTS + head % self.capacity * self.slot_size
+        _SLOT.pack_into(self._mmap, offset, seq, device, len(report))
+        self._view[offset + _SLOT.size:offset + _SLOT.size + len(report)] = report
+        self._set(_HEAD, seq)
+        return seq
+
+    # consumer side
+
+    def peek(self) -> Optional[tuple[int, int, memoryview]]:
+        tail = self._get(_TAIL)
+        if self._get(_HEAD) == tail:
+            return None
+        offset = _SLOTS + tail % self.capacity * self.slot_size
+        seq, device, n = _SLOT.unpack_from(self._mmap, offset)
+        return seq, device, self._view[offset + _SLOT.size:offset + _SLOT.size + n]
+
+    def pop(self, ok: bool = True) -> None:
+        seq = self._get(_TAIL) + 1
+        if not ok:
+            self._set(_FAILED, self._get(_FAILED) + 1)
+            self._set(_LAST_FAILED, seq)
+        self._set(_TAIL, seq)
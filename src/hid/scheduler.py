@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Callable, Iterable, Optional
+
+from hid import trace
+from hid.devices.hid_device import HIDDevice
+from hid.report.item import DataFlag, Input
+from hid.udc import UDCState, SUSPENDED
+
+_Frame = list[tuple[HIDDevice, bytes]]
+
+
+def _relative_bytes(device: HIDDevice) -> list[tuple[int, int]]:
+    # (byte index, mask of the bits to keep) for the bytes of relative input fields
+    if device.DESCRIPTOR is NotImplemented:
+        return []
+    masks: dict[int, int] = {}
+    for f in device.DESCRIPTOR.layout:
+        if f.kind is not Input or f.flags & (DataFlag.CONSTANT | DataFlag.RELATIVE) != DataFlag.RELATIVE:
+            continue
+        # reports with an ID are prefixed by it
+        start = f.offset + 8 * (f.report_id != 0)
+        for bit in range(start, start + f.size * f.count):
+            masks[bit // 8] = masks.get(bit // 8, 0) | 1 << bit % 8
+    return [(i, ~mask & 0xFF) for i, mask in sorted(masks.items())]
+
+
+class FrameScheduler:
+    # Reports are grouped into frames. A frame holds at most one report per device,
+    # is written in device order, and frames go out one `interval` apart, so reports
+    # from different devices that belong together reach the host in the same interval.
+    def __init__(self,
+                 devices: Iterable[HIDDevice],
+                 interval: float = 0.004,
+                 udc: Optional[UDCState] = None,
+                 clock: Callable[[], float] = time.perf_counter,
+                 sleep: Callable[[float], None] = time.sleep) -> None:
+        self.devices = list(devices)
+        self.interval = interval
+        # frames are held back while the host has the bus suspended
+        self.udc = udc
+        if udc is not None:
+            udc.start()
+        self.clock = clock
+        self.sleep = sleep
+        self._order = {id(d): i for i, d in enumerate(self.devices)}
+        self._frames: deque[_Frame] = deque()
+        self._last = {id(d): bytes(d.report) for d in self.devices}
+        self._relative = {id(d): _relative_bytes(d) for d in self.devices}
+        self._next = 0.0
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def commit(self, *devices: HIDDevice) -> None:
+        # without arguments, every device whose report changed since the last commit
+        # is included. Relative fields (e.g. mouse motion) are cleared once committed,
+        # so later reports don't repeat the motion.
+        if not devices:
+            devices = tuple(d for d in self.devices if bytes(d.report) != self._last[id(d)])
+        if not devices:
+            return
+        frame = []
+        for d in sorted(devices, key=lambda d: self._order[id(d)]):
+            frame.append((d, bytes(d.report)))
+            relative = self._relative[id(d)]
+            if relative:
+                report = memoryview(d.report).cast('B')
+                for i, keep in relative:
+                    report[i] &= keep
+            self._last[id(d)] = bytes(d.report)
+        self._frames.append(frame)
+
+    def tick(self) -> bool:
+        if not self._frames:
+            return False
+        frame = self._frames.popleft()
+        for device, report in frame:
+            device.send_report(report)
+        if trace.enabled:
+            trace.instant('frame flushed', reports=len(frame))
+        return True
+
+    def run(self) -> None:
+        while self._frames:
+            if self.udc is not None and self.udc.state == SUSPENDED:
+                self.udc.wait_while((SUSPENDED,))
+                self._next = 0.0
+            now = self.clock()
+            if now < self._next:
+                self.sleep(self._next - now)
+            # late frames don't try to catch up by bunching together
+            self._next = max(now, self._next) + self.interval
+            self.tick()
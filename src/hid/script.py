@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import string
+import time
+from array import array
+from ctypes import c_ubyte
+from math import ceil, floor
+from typing import Callable, Iterable, Mapping, Optional
+
+from hid.devices.hid_device import HIDDevice
+from hid.devices.keyboard import KeyboardReport, KeyCode, Modifier
+from hid.devices.mouse import MouseButton, MouseReport
+
+MODIFIERS = {
+    'CTRL': Modifier.LEFT_CONTROL,
+    'CONTROL': Modifier.LEFT_CONTROL,
+    'SHIFT': Modifier.LEFT_SHIFT,
+    'ALT': Modifier.LEFT_ALT,
+    'GUI': Modifier.LEFT_GUI,
+    'WINDOWS': Modifier.LEFT_GUI,
+    'COMMAND': Modifier.LEFT_GUI,
+}
+
+KEY_ALIASES = {
+    'ESC': 'ESCAPE',
+    'SPACE': 'SPACEBAR',
+    'BKSP': 'BACKSPACE',
+    'DEL': 'DELETE',
+    'CAPSLOCK': 'CAPS_LOCK',
+    'PRINTSCREEN': 'PRINT_SCREEN',
+    'SCROLLLOCK': 'SCROLL_LOCK',
+    'BREAK': 'PAUSE',
+    'PAGEUP': 'PAGE_UP',
+    'PAGEDOWN': 'PAGE_DOWN',
+    'UP': 'UP_ARROW',
+    'UPARROW': 'UP_ARROW',
+    'DOWN': 'DOWN_ARROW',
+    'DOWNARROW': 'DOWN_ARROW',
+    'LEFT': 'LEFT_ARROW',
+    'LEFTARROW': 'LEFT_ARROW',
+    'RIGHT': 'RIGHT_ARROW',
+    'RIGHTARROW': 'RIGHT_ARROW',
+    'MENU': 'APPLICATION',
+    'APP': 'APPLICATION',
+}
+
+
+class Timeline:
+    def __init__(self, devices: Iterable[str] = ()) -> None:
+        self.devices = list(devices)
+        self.times = array('q')
+        self.targets = array('B')
+        self.reports: list[bytes] = []
+
+    def __len__(self) -> int:
+        return len(self.reports)
+
+    @property
+    def duration(self) -> int:
+        return self.times[-1] if self.times else 0
+
+    def append(self, t: int, device: str, report: bytes) -> None:
+        if device not in self.devices:
+            self.devices.append(device)
+        self.times.append(t)
+        self.targets.append(self.devices.index(device))
+        self.reports.append(report)
+
+    def play(self,
+             devices: Mapping[str, HIDDevice],
+             spin: float = 0.0002,
+             clock: Callable[[], int] = time.perf_counter_ns,
+             sleep: Callable[[float], None] = time.sleep) -> int:
+        # everything is resolved up front so the loop only waits and writes
+        sends = [devices[name].send_report for name in self.devices]
+        spin_ns = int(spin * 1e9)
+        late = 0
+
+        start = clock()
+        for t, target, report in zip(self.times, self.targets, self.reports):
+            deadline = start + t
+            remaining = deadline - clock()
+            if remaining > spin_ns:
+                sleep((remaining - spin_ns) / 1e9)
+            while clock() < deadline:
+                pass
+            late = max(late, clock() - deadline)
+            sends[target](report)
+        return late
+
+
+class _Compiler:
+    def __init__(self, keyboard: str, mouse: str, interval: float, default_delay: float) -> None:
+        self.keyboard = keyboard
+        self.mouse = mouse
+        self.interval = round(interval * 1e9)
+        self.default_delay = round(default_delay * 1e9)
+        self.timeline = Timeline()
+        self.t = 0
+        self.buttons = 0
+        self._x = 0.0
+        self._y = 0.0
+
+    def emit(self, device: str, report: bytes) -> None:
+        self.timeline.append(self.t, device, report)
+        self.t += self.interval
+
+    def press(self, mods: int, keys: list[int]) -> None:
+        if len(keys) > 6:
+            raise ValueError('At most 6 keys can be pressed at once.')
+        self.emit(self.keyboard, bytes(KeyboardReport(mods=mods, keys=(c_ubyte * 6)(*keys))))
+        self.emit(self.keyboard, bytes(KeyboardReport()))
+
+    def key(self, name: str) -> tuple[int, int]:
+        if name in MODIFIERS:
+            return MODIFIERS[name], 0
+        name = KEY_ALIASES.get(name, name)
+        if name not in KeyCode.KEYBOARD:
+            raise ValueError(f'Unknown key: {name!r}')
+        # letters in chords are keys, not capitals
+        mods = Modifier.from_char(name) if len(name) == 1 and name not in string.ascii_letters else Modifier.NULL
+        return mods, KeyCode.KEYBOARD[name]
+
+    def mouse_report(self, x: int = 0, y: int = 0) -> bytes:
+        return bytes(MouseReport(buttons=self.buttons, x=x, y=y))
+
+    def move(self, x: float, y: float, t: Optional[float]) -> None:
+        if t is None:
+            n = max(1, ceil(max(abs(x), abs(y)) / 127))
+        else:
+            n = max(1, floor(t * 1e9 / self.interval))
+        if not (-127 <= x / n <= 127 and -127 <= y / n <= 127):
+            raise ValueError("Can't move that fast")
+        for _ in range(n):
+            self._x += x / n
+            self._y += y / n
+            dx, dy = floor(self._x), floor(self._y)
+            self._x -= dx
+            self._y -= dy
+            self.emit(self.mouse, self.mouse_report(dx, dy))
+
+    def button(self, name: str) -> int:
+        try:
+            return MouseButton[name]
+        except KeyError:
+            raise ValueError(f'Unknown mouse button: {name!r}') from None
+
+    def command(self, line: str) -> None:
+        command, _, arg = line.partition(' ')
+        words = arg.split()
+
+        if command == 'STRING' or command == 'STRINGLN':
+            for c in arg + ('\n' if command == 'STRINGLN' else ''):
+                if c not in KeyCode.KEYBOARD:
+                    raise ValueError(f"Can't type {c!r}")
+                self.press(Modifier.from_char(c), [KeyCode.KEYBOARD[c]])
+        elif command == 'DELAY':
+            self.t += round(float(arg) * 1e6)
+        elif command == 'MOUSE_MOVE':
+            if len(words) not in (2, 3):
+                raise ValueError('MOUSE_MOVE takes x, y and an optional duration in ms.')
+            self.move(float(words[0]), float(words[1]), float(words[2]) / 1000 if len(words) == 3 else None)
+        elif command in ('MOUSE_CLICK', 'MOUSE_PRESS', 'MOUSE_RELEASE'):
+            button = self.button(words[0] if words else 'LEFT')
+            if command != 'MOUSE_RELEASE':
+                self.buttons |= button
+                self.emit(self.mouse, self.mouse_report())
+            if command != 'MOUSE_PRESS':
+                self.buttons &= ~button
+                self.emit(self.mouse, self.mouse_report())
+        else:
+            mods, keys = 0, []
+            # CTRL-ALT DELETE style chords, but a lone '-' is the minus key
+            names = [n for word in line.split() for n in ([word] if word == '-' else word.split('-'))]
+            for name in names:
+                m, k = self.key(name)
+                mods |= m
+                if k:
+                    keys.append(k)
+            self.press(mods, keys)
+        self.t += self.default_delay
+
+
+def compile_script(source: str,
+                   keyboard: str = 'keyboard',
+                   mouse: str = 'mouse',
+                   interval: float = 0.004,
+                   default_delay: float = 0) -> Timeline:
+    compiler = _Compiler(keyboard, mouse, interval, default_delay)
+    previous: Optional[str] = None
+
+    for n, line in enumerate(source.splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith('REM'):
+            continue
+        command, _, arg = line.partition(' ')
+        try:
+            if command in ('DEFAULT_DELAY', 'DEFAULTDELAY'):
+                compiler.default_delay = round(float(arg) * 1e6)
+            elif command == 'REPEAT':
+                if previous is None:
+                    raise ValueError('Nothing to repeat.')
+                for _ in range(int(arg)):
+                    compiler.command(previous)
+            else:
+                compiler.command(line)
+                previous = line
+        except ValueError as e:
+            raise ValueError(f'Line {n}: {e}') from e
+
+    return compiler.timeline
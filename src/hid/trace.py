@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import Any, Iterator, Optional, TextIO
+
+# Call sites check `trace.enabled` before recording anything, so tracing costs a
+# single attribute lookup while it's off. span() can be used unguarded: while
+# tracing is off it returns a shared context manager that does nothing.
+enabled = False
+_NO_SPAN: AbstractContextManager[None] = nullcontext()
+
+_capacity = 0
+_counter = itertools.count()
+_names: list[Optional[str]] = []
+_phases: list[str] = []
+_timestamps: list[int] = []
+_threads: list[int] = []
+_args: list[Optional[dict[str, Any]]] = []
+
+
+def enable(capacity: int = 1 << 16) -> None:
+    global enabled, _capacity, _names, _phases, _timestamps, _threads, _args
+    _capacity = capacity
+    _names = [None] * capacity
+    _phases = [''] * capacity
+    _timestamps = [0] * capacity
+    _threads = [0] * capacity
+    _args = [None] * capacity
+    clear()
+    enabled = True
+
+
+def disable() -> None:
+    global enabled
+    enabled = False
+
+
+def clear() -> None:
+    global _counter
+    _counter = itertools.count()
+    for i in range(_capacity):
+        _names[i] = None
+        _args[i] = None
+
+
+def _record(phase: str, name: str, args: Optional[dict[str, Any]]) -> None:
+    if not enabled:
+        return
+    # next() on a count is atomic under the GIL, so threads never share a slot
+    i = next(_counter) % _capacity
+    _timestamps[i] = time.monotonic_ns()
+    _names[i] = name
+    _phases[i] = phase
+    _threads[i] = threading.get_ident()
+    _args[i] = args
+
+
+def begin(name: str, /, **args: Any) -> None:
+    _record('B', name, args or None)
+
+
+def end(name: str, /, **args: Any) -> None:
+    _record('E', name, args or None)
+
+
+def instant(name: str, /, **args: Any) -> None:
+    _record('i', name, args or None)
+
+
+@contextmanager
+def _span(name: str, args: dict[str, Any]) -> Iterator[None]:
+    _record('B', name, args or None)
+    try:
+        yield
+    finally:
+        _record('E', name, None)
+
+
+def span(name: str, /, **args: Any) -> AbstractContextManager[None]:
+    if not enabled:
+        return _NO_SPAN
+    return _span(name, args)
+
+
+def sleep(seconds: float) -> None:
+    t = time.monotonic_ns()
+    time.sleep(seconds)
+    instant('sleep overshoot', overshoot_ns=time.monotonic_ns() - t - round(seconds * 1e9))
+
+
+def events() -> list[dict[str, Any]]:
+    pid = os.getpid()
+    recorded = []
+    for i in range(_capacity):
+        name = _names[i]
+        if name is None:
+            continue
+        event: dict[str, Any] = {
+            'name': name,
+            'cat': 'hid',
+            'ph': _phases[i],
+            'ts': _timestamps[i] / 1000,
+            'pid': pid,
+            'tid': _threads[i],
+        }
+        if _phases[i] == 'i':
+            event['s'] = 't'
+        if _args[i] is not None:
+            event['args'] = _args[i]
+        recorded.append(event)
+    # the ring wraps around, so slot order isn't chronological
+    recorded.sort(key=lambda e: e['ts'])
+    return recorded
+
+
+def dump(f: TextIO) -> None:
+    json.dump({'traceEvents': events(), 'displayTimeUnit': 'ns'}, f)
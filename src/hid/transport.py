@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import os
+import socket
+
+from typing_extensions import Buffer
+
+
+class Transport:
+    def write(self, report: Buffer) -> None:
+        raise NotImplementedError
+
+    def readinto(self, buffer: Buffer) -> int:
+        raise NotImplementedError
+
+    def fileno(self) -> int:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class DeviceTransport(Transport):
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._fd = os.open(path, os.O_RDWR)
+
+    def write(self, report: Buffer) -> None:
+        os.write(self._fd, report)
+
+    def readinto(self, buffer: Buffer) -> int:
+        return os.readv(self._fd, [buffer])
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def close(self) -> None:
+        if self._fd != -1:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class SocketTransport(Transport):
+    def __init__(self, sock: socket.socket) -> None:
+        self.socket = sock
+
+    def write(self, report: Buffer) -> None:
+        self.socket.send(report)
+
+    def readinto(self, buffer: Buffer) -> int:
+        return self.socket.recv_into(buffer)
+
+    def fileno(self) -> int:
+        return self.socket.fileno()
+
+    def close(self) -> None:
+        self.socket.close()
+
+
+# Stands in for /dev/hidgN in tests; `host` is the end the USB host would see
+class LoopbackTransport(SocketTransport):
+    def __init__(self) -> None:
+        # SOCK_SEQPACKET keeps report boundaries, like the gadget device does
+        device, host = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        super().__init__(device)
+        self.host = SocketTransport(host)
+
+    def close(self) -> None:
+        super().close()
+        self.host.close()
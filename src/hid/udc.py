@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import threading
+from typing import Callable, Iterable, Optional
+
+# Values of /sys/class/udc/<udc>/state, see usb_state_string() in the kernel
+NOT_ATTACHED = 'not attached'
+ATTACHED = 'attached'
+POWERED = 'powered'
+DEFAULT = 'default'
+ADDRESSED = 'addressed'
+CONFIGURED = 'configured'
+SUSPENDED = 'suspended'
+
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = os.O_CLOEXEC
+
+_StateCallback = Callable[[str, str], None]
+
+
+def _inotify(directory: str) -> Optional[int]:
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        fd: int = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    mask = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+    if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+class UDCState:
+    # sysfs attributes can't be watched with inotify, but the kernel wakes up POLLPRI
+    # pollers when the state changes. Anything else (e.g. a fake sysfs in tests) is
+    # watched with inotify, falling back to polling every `interval` seconds.
+    def __init__(self, path: str, sysfs: Optional[bool] = None, interval: float = 0.01) -> None:
+        self.path = path
+        self.sysfs = path.startswith('/sys/') if sysfs is None else sysfs
+        self.interval = interval
+        self._callbacks: list[_StateCallback] = []
+        self._changed = threading.Condition()
+        self._state = self.read()
+        self._thread: Optional[threading.Thread] = None
+        self._wakeup: Optional[tuple[int, int]] = None
+
+    def read(self) -> str:
+        try:
+            with open(self.path, 'rt') as f:
+                return f.read().strip()
+        except FileNotFoundError:
+            return NOT_ATTACHED
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def add_callback(self, callback: _StateCallback) -> None:
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback: _StateCallback) -> None:
+        self._callbacks.remove(callback)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._wakeup = os.pipe()
+        self._thread = threading.Thread(target=self._watch, name=f'UDCState({self.path})', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None or self._wakeup is None:
+            return
+        os.write(self._wakeup[1], b'\0')
+        self._thread.join()
+        for fd in self._wakeup:
+            os.close(fd)
+        self._thread = None
+        self._wakeup = None
+
+    def wait_for(self, states: Iterable[str], timeout: Optional[float] = None) -> bool:
+        states = frozenset(states)
+        self.start()
+        with self._changed:
+            return self._changed.wait_for(lambda: self._state in states, timeout)
+
+    def wait_while(self, states: Iterable[str], timeout: Optional[float] = None) -> bool:
+        states = frozenset(states)
+        self.start()
+        with self._changed:
+            return self._changed.wait_for(lambda: self._state not in states, timeout)
+
+    def _update(self, state: str) -> None:
+        # a file that's being rewritten is briefly empty
+        if not state:
+            return
+        with self._changed:
+            old, self._state = self._state, state
+            if old == state:
+                return
+            self._changed.notify_all()
+        for callback in list(self._callbacks):
+            try:
+                callback(old, state)
+            except Exception as e:
+                # report it like an uncaught exception, but keep watching for the others
+                threading.excepthook(threading.ExceptHookArgs((type(e), e, e.__traceback__, threading.current_thread())))
+
+    def _watch(self) -> None:
+        assert self._wakeup is not None
+        poller = select.poll()
+        poller.register(self._wakeup[0], select.POLLIN)
+
+        notify: Optional[int] = None
+        fd: Optional[int] = None
+        if self.sysfs:
+            fd = os.open(self.path, os.O_RDONLY)
+            poller.register(fd, select.POLLPRI | select.POLLERR)
+        else:
+            notify = _inotify(os.path.dirname(self.path) or '.')
+            if notify is not None:
+                poller.register(notify, select.POLLIN)
+        timeout = None if fd is not None or notify is not None else self.interval * 1000
+
+        try:
+            # the state may have changed between __init__ and registering
+            self._update(self.read())
+            while True:
+                if fd is not None:
+                    # sysfs only notifies pollers that have read the attribute since the last change
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    os.read(fd, 64)
+                events = poller.poll(timeout)
+                if any(e_fd == self._wakeup[0] for e_fd, _ in events):
+                    return
+                if notify is not None:
+                    try:
+                        while os.read(notify, 4096):
+                            pass
+                    except OSError as e:
+                        if e.errno != errno.EAGAIN:
+                            raise
+                self._update(self.read())
+        finally:
+            for x in (fd, notify):
+                if x is not None:
+                    os.close(x)
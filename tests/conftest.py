@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+from hid.devices.hid_device import HIDDevice
+from hid.gadget import Gadget
+from hid.transport import LoopbackTransport
+
+
+class FakeConfigfs:
+    # The kernel provides a gadget's `UDC` and a function's `dev` attributes; here they
+    # have to exist beforehand
+    def __init__(self, root: str) -> None:
+        self.path = os.path.join(root, 'usb_gadget')
+        self.udc_path = os.path.join(root, 'udc')
+        os.makedirs(os.path.join(self.udc_path, 'fake.udc'))
+        self.set_state('not attached')
+        self._minor = 0
+
+    @property
+    def state_path(self) -> str:
+        return os.path.join(self.udc_path, 'fake.udc', 'state')
+
+    def set_state(self, state: str) -> None:
+        # replaced rather than rewritten in place, so readers never see an empty file
+        tmp = self.state_path + '.tmp'
+        with open(tmp, 'wt') as f:
+            f.write(state + '\n')
+        os.replace(tmp, self.state_path)
+
+    def prepare(self, gadget: str, *functions: str) -> None:
+        os.makedirs(os.path.join(self.path, gadget), exist_ok=True)
+        with open(os.path.join(self.path, gadget, 'UDC'), 'wt') as f:
+            f.write('\n')
+        for name in functions:
+            d = os.path.join(self.path, gadget, 'functions', f'hid.{name}')
+            os.makedirs(d)
+            with open(os.path.join(d, 'dev'), 'wt') as f:
+                f.write(f'236:{self._minor}\n')
+            self._minor += 1
+
+
+def received(device: HIDDevice) -> list[bytes]:
+    # drains what the host end of a device's LoopbackTransport has been sent
+    assert isinstance(device.transport, LoopbackTransport)
+    host = device.transport.host.socket
+    host.setblocking(False)
+    reports = []
+    while True:
+        try:
+            reports.append(host.recv(64))
+        except BlockingIOError:
+            return reports
+
+
+@pytest.fixture
+def configfs(tmp_path, monkeypatch) -> FakeConfigfs:
+    fake = FakeConfigfs(str(tmp_path))
+    monkeypatch.setattr(Gadget, 'UDC_PATH', fake.udc_path)
+    return fake
@@ -0,0 +1,53 @@
+import os
+
+import pytest
+
+from hid.devices import Keyboard, Mouse
+from hid.report import ReportDescriptor, cache
+from hid.report.item import *
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, 'directory', str(tmp_path))
+    return tmp_path
+
+
+def test_round_trip(cache_dir) -> None:
+    for descriptor in (Keyboard.DESCRIPTOR, Mouse.DESCRIPTOR):
+        compiled = ReportDescriptor(bytes(descriptor))
+        entry = cache.load(bytes(descriptor))
+        assert entry is not None
+        assert entry.layout == compiled.layout == descriptor.layout
+        assert entry.input_len == descriptor.input_len
+        assert entry.output_len == descriptor.output_len
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_disabled(monkeypatch) -> None:
+    monkeypatch.setattr(cache, 'directory', None)
+    ReportDescriptor(bytes(Mouse.DESCRIPTOR))
+    assert cache.load(bytes(Mouse.DESCRIPTOR)) is None
+
+
+def test_corrupt_entry_is_ignored(cache_dir) -> None:
+    data = bytes(Mouse.DESCRIPTOR)
+    ReportDescriptor(data)
+    with open(cache._path(data), 'wb') as f:
+        f.write(b'HIDC garbage')
+    assert cache.load(data) is None
+    assert ReportDescriptor(data).layout == Mouse.DESCRIPTOR.layout
+
+
+def test_unencodable_descriptor_still_compiles(cache_dir) -> None:
+    # the extended usage doesn't fit the 32 bit usage field of an entry
+    descriptor = ReportDescriptor((
+        UsagePage(0x10000),
+        Usage(1),
+        ReportSize(8),
+        ReportCount(1),
+        Input(DataFlag.VARIABLE),
+    ))
+    assert descriptor.layout[0].usages == (0x10000 << 16 | 1,)
+    assert cache.load(bytes(descriptor)) is None
+    assert os.listdir(cache_dir) == []
@@ -0,0 +1,163 @@
+import os
+import threading
+
+import pytest
+
+from hid.channel import Channel, DATA, FIN
+from hid.transport import LoopbackTransport, SocketTransport, Transport
+
+
+class DroppingTransport(Transport):
+    # loses the data frames whose (0 based) index is in `drop`, the first time they're sent
+    def __init__(self, transport: SocketTransport, drop: set[int]) -> None:
+        self.transport = transport
+        self.drop = drop
+        self.frames = 0
+
+    def write(self, report) -> None:
+        if bytes(report)[0] & DATA:
+            self.frames += 1
+            if self.frames - 1 in self.drop:
+                return
+        self.transport.write(report)
+
+    def readinto(self, buffer) -> int:
+        return self.transport.readinto(buffer)
+
+    def fileno(self) -> int:
+        return self.transport.fileno()
+
+
+@pytest.fixture
+def loopback():
+    transport = LoopbackTransport()
+    yield transport
+    transport.close()
+
+
+def _transfer(sender: Channel, receiver: Channel, data: bytes) -> bytes:
+    def send() -> None:
+        sender.send(data)
+        sender.close(timeout=5)
+
+    thread = threading.Thread(target=send)
+    thread.start()
+    received = bytearray()
+    while True:
+        chunk = receiver.recv(timeout=5)
+        if not chunk:
+            break
+        received += chunk
+    thread.join(5)
+    assert not thread.is_alive()
+    return bytes(received)
+
+
+def test_round_trip(loopback) -> None:
+    device, host = Channel(loopback), Channel(loopback.host)
+    data = os.urandom(1000)
+    assert _transfer(device, host, data) == data
+    assert host.eof
+
+
+def test_sequence_wraparound(loopback) -> None:
+    device, host = Channel(loopback), Channel(loopback.host)
+    data = os.urandom(device.payload_len * 600)
+    assert _transfer(device, host, data) == data
+    # 600 data frames numbered modulo 256, FIN either rides on the last one or follows it
+    assert device._next in (600 % 256, 601 % 256)
+    assert host._expected == device._next
+
+
+def test_both_directions(loopback) -> None:
+    device, host = Channel(loopback), Channel(loopback.host)
+    assert _transfer(host, device, b'ping') == b'ping'
+    assert _transfer(device, host, b'pong') == b'pong'
+
+
+def test_retransmission(loopback) -> None:
+    lossy = DroppingTransport(loopback, drop={2, 5, 300})
+    device, host = Channel(lossy, timeout=0.01), Channel(loopback.host)
+    data = os.urandom(device.payload_len * 400)
+    assert _transfer(device, host, data) == data
+    assert device.retransmissions > 0
+
+
+def test_lost_fin(loopback) -> None:
+    lossy = DroppingTransport(loopback, drop={1})
+    device, host = Channel(lossy, timeout=0.01), Channel(loopback.host)
+    assert _transfer(device, host, b'x' * device.payload_len) == b'x' * device.payload_len
+    assert host.eof
+
+
+def test_eof(loopback) -> None:
+    device, host = Channel(loopback), Channel(loopback.host)
+    assert _transfer(device, host, b'') == b''
+    assert host.eof
+    # end of stream is returned straight away, not waited for
+    assert host.recv(timeout=0) == b''
+    with pytest.raises(ValueError):
+        device.send(b'more')
+
+
+def test_recv_timeout(loopback) -> None:
+    host = Channel(loopback.host)
+    with pytest.raises(TimeoutError):
+        host.recv(timeout=0.01)
+    assert not host.eof
+
+
+def test_peer_gone(loopback) -> None:
+    device, host = Channel(loopback), Channel(loopback.host)
+    device.send(b'last words')
+    loopback.socket.close()
+    assert host.recv(timeout=1) == b'last words'
+    with pytest.raises(ConnectionResetError):
+        host.recv(timeout=1)
+    with pytest.raises(ConnectionResetError):
+        host.makefile().read(1)
+    host.close(timeout=1)
+    assert host.closed
+
+
+def test_window(loopback) -> None:
+    device = Channel(loopback, window=4)
+    # nobody acknowledges anything, so only a window's worth goes out
+    assert device.send(bytes(device.payload_len * 10), timeout=0.01) == device.payload_len * 10
+    assert len(device._unacked) == 4
+
+    frames = []
+    loopback.host.socket.setblocking(False)
+    while True:
+        try:
+            frames.append(loopback.host.socket.recv(64))
+        except BlockingIOError:
+            break
+    assert [frame[1] for frame in frames if frame[0] & DATA] == [0, 1, 2, 3]
+    assert not any(frame[0] & FIN for frame in frames)
+
+
+@pytest.mark.parametrize('window', [0, 128])
+def test_invalid_window(loopback, window: int) -> None:
+    with pytest.raises(ValueError):
+        Channel(loopback, window=window)
+
+
+def test_makefile(loopback) -> None:
+    device, host = Channel(loopback), Channel(loopback.host)
+    data = os.urandom(5000)
+
+    def write() -> None:
+        with device.makefile() as f:
+            f.write(data)
+
+    thread = threading.Thread(target=write)
+    thread.start()
+    f = host.makefile()
+    assert f.readall() == data
+    thread.join(5)
+    assert not thread.is_alive()
+    # the device side is gone, so the FIN is never acknowledged; closing still returns
+    host.close(timeout=0)
+    f.close()
+    assert f.closed
@@ -0,0 +1,91 @@
+import pytest
+
+from hid.daemon import ReportClient, ReportDaemon
+from hid.devices import Mouse
+from hid.transport import LoopbackTransport
+from .conftest import received
+
+
+def _mouse(name: str) -> Mouse:
+    mouse = Mouse(name)
+    mouse.transport = LoopbackTransport()
+    return mouse
+
+
+@pytest.fixture
+def devices():
+    devices = [_mouse('mouse'), _mouse('other')]
+    yield devices
+    for d in devices:
+        d.close()
+
+
+@pytest.fixture
+def daemon(tmp_path, devices):
+    with ReportDaemon(devices, str(tmp_path), intervals={'mouse': 0, 'other': 0}) as daemon:
+        yield daemon
+
+
+def test_manifest(daemon: ReportDaemon) -> None:
+    with ReportClient(daemon.directory, 'client') as client:
+        assert client.devices == ['mouse', 'other']
+        with pytest.raises(ValueError):
+            client.submit('mouse', b'\0')
+
+
+def test_delivery_and_acks(daemon: ReportDaemon, devices: list[Mouse]) -> None:
+    with ReportClient(daemon.directory, 'client') as client:
+        seqs = [client.submit('mouse', bytes([1, i, 0])) for i in range(3)]
+        client.submit('other', bytes([2, 0, 0]))
+        assert not client.wait(seqs[-1], timeout=0)
+        assert daemon.poll() == 4
+        assert client.wait(timeout=0)
+        assert client.acked == 4
+        assert client.failed == 0
+    assert received(devices[0]) == [bytes([1, i, 0]) for i in range(3)]
+    assert received(devices[1]) == [bytes([2, 0, 0])]
+
+
+def test_round_robin(daemon: ReportDaemon, devices: list[Mouse]) -> None:
+    with ReportClient(daemon.directory, 'a') as a, ReportClient(daemon.directory, 'b') as b:
+        for i in range(3):
+            a.submit('mouse', bytes([0, i, 0]))
+            b.submit('mouse', bytes([1, i, 0]))
+        assert daemon.poll() == 6
+    clients = [report[0] for report in received(devices[0])]
+    # one report per client per pass
+    assert clients in ([0, 1] * 3, [1, 0] * 3)
+
+
+def test_pacing(tmp_path, devices: list[Mouse]) -> None:
+    with ReportDaemon(devices, str(tmp_path), intervals={'mouse': 60, 'other': 0}) as daemon, \
+            ReportClient(daemon.directory, 'client') as client:
+        client.submit('mouse', bytes(3))
+        client.submit('mouse', bytes(3))
+        assert daemon.poll() == 1
+        assert daemon.poll() == 0
+        assert len(client.ring) == 1
+        assert daemon.next_deadline() == daemon._deadlines[0]
+    assert len(received(devices[0])) == 1
+
+
+def test_failures_are_counted(tmp_path) -> None:
+    # no device node and no transport, so the device can't be opened
+    unopened = Mouse('mouse')
+    with ReportDaemon([unopened], str(tmp_path), intervals={'mouse': 0}) as daemon, \
+            ReportClient(daemon.directory, 'client') as client:
+        client.submit('mouse', bytes(3))
+        seq = client.submit('mouse', bytes(3))
+        assert daemon.poll() == 0
+        assert client.wait(seq, timeout=0)
+        assert client.failed == 2
+        assert client.ring.last_failed == seq
+
+
+def test_closed_client_is_dropped(daemon: ReportDaemon) -> None:
+    client = ReportClient(daemon.directory, 'client')
+    daemon.scan()
+    assert daemon._order == ['client']
+    client.close()
+    daemon.scan()
+    assert daemon._order == []
@@ -0,0 +1,62 @@
+import os
+
+import pytest
+
+from hid import trace
+from hid.devices import Keyboard, Mouse
+from hid.gadget import Gadget
+
+
+@pytest.fixture
+def gadget(configfs):
+    configfs.prepare('g', 'kb', 'mouse')
+    return Gadget([Keyboard('kb'), Mouse('mouse')], path=configfs.path, name='g')
+
+
+def test_create(gadget, configfs) -> None:
+    assert gadget.udc == 'fake.udc'
+    assert gadget.enabled
+    assert [d.name for d in gadget.devices] == ['kb', 'mouse']
+    assert (gadget.kb.dev, gadget.mouse.dev) == ('/dev/hidg0', '/dev/hidg1')
+    assert gadget.functions['hid.kb/report_desc'] == bytes(Keyboard.DESCRIPTOR)
+    assert os.path.islink(os.path.join(configfs.path, 'g', 'configs/c.1/hid.mouse'))
+
+
+def test_attach(gadget, configfs) -> None:
+    attached = Gadget.attach('g', [Mouse('mouse'), Keyboard('kb')], path=configfs.path)
+    assert attached.udc == 'fake.udc'
+    assert attached.enabled
+    assert (attached.kb.dev, attached.mouse.dev) == (gadget.kb.dev, gadget.mouse.dev)
+
+
+def test_attach_binds_unbound_gadget(gadget, configfs) -> None:
+    gadget.enabled = False
+    attached = Gadget.attach('g', [Keyboard('kb'), Mouse('mouse')], path=configfs.path)
+    assert attached.enabled
+
+
+def test_attach_missing(configfs) -> None:
+    with pytest.raises(FileNotFoundError):
+        Gadget.attach('missing', [], path=configfs.path)
+
+
+@pytest.mark.parametrize('functions, message', [
+    (lambda: [Keyboard('kb')], 'has the functions'),
+    (lambda: [Keyboard('kb'), Keyboard('mouse')], 'report descriptor'),
+])
+def test_attach_mismatch(gadget, configfs, functions, message) -> None:
+    trace.enable(256)
+    try:
+        with pytest.raises(ValueError, match=message):
+            Gadget.attach('g', functions(), path=configfs.path)
+        phases = [(e['name'], e['ph']) for e in trace.events()]
+        assert phases[0] == ('Gadget.attach', 'B') and phases[-1] == ('Gadget.attach', 'E')
+    finally:
+        trace.disable()
+        trace.clear()
+
+
+def test_attach_unconfigured_function(gadget, configfs) -> None:
+    os.remove(os.path.join(configfs.path, 'g', 'configs/c.1/hid.mouse'))
+    with pytest.raises(ValueError, match='configuration'):
+        Gadget.attach('g', [Keyboard('kb'), Mouse('mouse')], path=configfs.path)
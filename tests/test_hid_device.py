@@ -0,0 +1,85 @@
+from ctypes import Structure, c_ubyte
+
+import pytest
+
+from hid.devices import Keyboard, Mouse
+from hid.devices.hid_device import HIDDevice
+from hid.devices.mouse import MouseReport
+from hid.report.item import DataFlag, Input
+from hid.transport import LoopbackTransport, Transport
+from .conftest import received
+
+
+class RecordingTransport(Transport):
+    def __init__(self) -> None:
+        self.written: list[tuple[object, bytes]] = []
+
+    def write(self, report) -> None:
+        self.written.append((report, bytes(report)))
+
+
+@pytest.fixture
+def mouse():
+    mouse = Mouse('m', frequency=10_000)
+    mouse.transport = LoopbackTransport()
+    yield mouse
+    mouse.close()
+
+
+@pytest.mark.parametrize('report', [
+    MouseReport(buttons=1, x=2, y=3),
+    memoryview(b'\x01\x02\x03'),
+    bytearray(b'\x01\x02\x03'),
+    [1, 2, 3],
+    iter([1, 2, 3]),
+])
+def test_send_report(mouse: Mouse, report) -> None:
+    mouse.send_report(report)
+    assert received(mouse) == [b'\x01\x02\x03']
+
+
+@pytest.mark.parametrize('report', [b'\x01\x02', memoryview(bytes(4)), [1, 2, 3, 4]])
+def test_send_report_wrong_length(mouse: Mouse, report) -> None:
+    with pytest.raises(ValueError):
+        mouse.send_report(report)
+    assert received(mouse) == []
+
+
+def test_report_size_is_checked() -> None:
+    class TooShort(Structure):
+        _fields_ = [('buttons', c_ubyte)]
+
+    with pytest.raises(ValueError):
+        class BrokenMouse(HIDDevice):
+            DESCRIPTOR = Mouse.DESCRIPTOR
+            REPORT = TooShort
+
+
+def test_click_down_and_up(mouse: Mouse) -> None:
+    mouse.click(direction='down')
+    assert received(mouse) == [b'\x01\x00\x00']
+    mouse.click(direction='up')
+    assert received(mouse) == [b'\x00\x00\x00']
+    with pytest.raises(ValueError):
+        mouse.click(direction='sideways')  # type: ignore[arg-type]
+
+
+def test_flags_are_integers() -> None:
+    # IntFlag members are iterable on 3.11+, but are still item data, not bytes
+    assert Input(DataFlag.VARIABLE | DataFlag.RELATIVE) == Input(0x06) == bytes([0x81, 0x06])
+    assert Input(DataFlag.BUFFER) == bytes([0x82, 0x00, 0x01])
+    assert Input(b'\x06') == Input(0x06)
+
+
+def test_type_sends_the_report_buffer() -> None:
+    keyboard = Keyboard('kb')
+    transport = RecordingTransport()
+    keyboard.transport = transport
+    keyboard.type('hI')
+    assert all(report is keyboard.report for report, _ in transport.written)
+    assert [data for _, data in transport.written] == [
+        bytes([0, 0, 0x0B, 0, 0, 0, 0, 0]),
+        bytes(8),
+        bytes([0x02, 0, 0x0C, 0, 0, 0, 0, 0]),
+        bytes(8),
+    ]
@@ -0,0 +1,91 @@
+import os
+
+import pytest
+
+from hid.devices import Keyboard, Mouse
+from hid.host import HIDRawDevice, enumerate_devices
+from hid.report.usage import GenericDesktop, UsagePages
+
+
+class FakeHIDRaw:
+    # /sys/class/hidraw/<name>/device/... and a FIFO standing in for /dev/<name>
+    def __init__(self, root: str) -> None:
+        self.sysfs = os.path.join(root, 'sys')
+        self.dev = os.path.join(root, 'dev')
+        os.makedirs(self.sysfs)
+        os.makedirs(self.dev)
+        self._writers: list[int] = []
+
+    def add(self, name: str, descriptor: bytes, hid_id: str = '') -> None:
+        device = os.path.join(self.sysfs, name, 'device')
+        os.makedirs(device)
+        with open(os.path.join(device, 'report_descriptor'), 'wb') as f:
+            f.write(descriptor)
+        if hid_id:
+            with open(os.path.join(device, 'uevent'), 'wt') as f:
+                f.write(f'DRIVER=hid-generic\nHID_ID={hid_id}\nHID_NAME=Test\n')
+        os.mkfifo(os.path.join(self.dev, name))
+
+    def writer(self, name: str) -> int:
+        fd = os.open(os.path.join(self.dev, name), os.O_WRONLY)
+        self._writers.append(fd)
+        return fd
+
+    def close(self) -> None:
+        for fd in self._writers:
+            os.close(fd)
+
+
+@pytest.fixture
+def hidraw(tmp_path):
+    fake = FakeHIDRaw(str(tmp_path))
+    fake.add('hidraw10', bytes(Keyboard.DESCRIPTOR))
+    fake.add('hidraw2', bytes(Mouse.DESCRIPTOR), hid_id='0003:00001D6B:00000104')
+    yield fake
+    fake.close()
+
+
+def test_enumerate(hidraw) -> None:
+    devices = enumerate_devices(hidraw.sysfs, hidraw.dev)
+    assert [d.name for d in devices] == ['hidraw2', 'hidraw10']
+    mouse, keyboard = devices
+    assert mouse.descriptor == Mouse.DESCRIPTOR
+    assert (mouse.vendor_id, mouse.product_id) == (0x1d6b, 0x0104)
+    assert mouse.uevent['HID_NAME'] == 'Test'
+    assert keyboard.vendor_id is None and keyboard.product_id is None
+
+
+def test_enumerate_without_hidraw(tmp_path) -> None:
+    assert enumerate_devices(str(tmp_path / 'missing'), str(tmp_path)) == []
+
+
+def test_read_reports(hidraw) -> None:
+    with HIDRawDevice('hidraw2', hidraw.sysfs, hidraw.dev) as mouse:
+        assert not mouse.wait(timeout=0)
+        assert mouse.read_reports() == []
+        fd = hidraw.writer('hidraw2')
+        for report in (b'\x01\x05\xfb', b'\x00\x00\x00', b'\x02\x01\x01'):
+            os.write(fd, report)
+        assert mouse.wait(timeout=1)
+        assert mouse.read_reports(limit=2) == [b'\x01\x05\xfb', b'\x00\x00\x00']
+        assert mouse.read_reports() == [b'\x02\x01\x01']
+
+
+def test_read_events(hidraw) -> None:
+    with HIDRawDevice('hidraw2', hidraw.sysfs, hidraw.dev) as mouse:
+        fd = hidraw.writer('hidraw2')
+        os.write(fd, b'\x05\x05\xfb')
+        button = UsagePages.BUTTON << 16
+        x, y = (UsagePages.GENERIC_DESKTOP << 16 | u for u in (GenericDesktop.X, GenericDesktop.Y))
+        assert mouse.read_events() == [[(button | 1, 1), (button | 2, 0), (button | 3, 1), (x, 5), (y, -5)]]
+
+
+def test_read_keyboard_events(hidraw) -> None:
+    with HIDRawDevice('hidraw10', hidraw.sysfs, hidraw.dev) as keyboard:
+        fd = hidraw.writer('hidraw10')
+        os.write(fd, bytes([0x02, 0, 0x04, 0, 0, 0, 0, 0]))
+        os.write(fd, bytes(8))
+        pressed, released = keyboard.read_events()
+        keyboard_page = UsagePages.KEYBOARD << 16
+        assert [usage for usage, value in pressed if value] == [keyboard_page | 0xE1, keyboard_page | 0x04]
+        assert not any(value for usage, value in released)
@@ -0,0 +1,90 @@
+from hid.devices import Keyboard, Mouse
+from hid.report import ReportDescriptor, compile_layout, optimize
+from hid.report.item import *
+from hid.report.usage import UsagePages, GenericDesktop
+
+
+def _optimized(*items: BaseItem) -> list[BaseItem]:
+    result = optimize(items)
+    assert compile_layout(result) == compile_layout(items)
+    return result
+
+
+def test_keyboard_drops_restated_logical_minimum() -> None:
+    optimized = Keyboard.DESCRIPTOR.optimize()
+    assert len(optimized) == len(Keyboard.DESCRIPTOR) - 2
+    assert optimized.layout == Keyboard.DESCRIPTOR.layout
+    assert sum(isinstance(x, LogicalMinimum) for x in Keyboard.DESCRIPTOR.items()) == 2
+    assert sum(isinstance(x, LogicalMinimum) for x in optimized.items()) == 1
+
+
+def test_mouse_is_already_minimal() -> None:
+    assert Mouse.DESCRIPTOR.optimize() == Mouse.DESCRIPTOR
+
+
+def test_usage_run_collapses_to_range() -> None:
+    result = _optimized(
+        UsagePage(UsagePages.BUTTON),
+        Usage(1), Usage(2), Usage(3), Usage(4),
+        LogicalMinimum(0), LogicalMaximum(1), ReportSize(1), ReportCount(4),
+        Input(DataFlag.VARIABLE),
+    )
+    assert result[1:3] == [UsageMinimum(1), UsageMaximum(4)]
+    assert not any(isinstance(x, Usage) for x in result)
+
+
+def test_short_usage_run_is_kept() -> None:
+    result = _optimized(
+        UsagePage(UsagePages.GENERIC_DESKTOP),
+        Usage(GenericDesktop.X), Usage(GenericDesktop.Y),
+        ReportSize(8), ReportCount(2),
+        Input(DataFlag.VARIABLE | DataFlag.RELATIVE),
+    )
+    assert result[1:3] == [Usage(GenericDesktop.X), Usage(GenericDesktop.Y)]
+
+
+def test_usages_inside_open_range_are_kept() -> None:
+    result = _optimized(
+        UsagePage(UsagePages.BUTTON),
+        UsageMinimum(1), Usage(5), Usage(6), Usage(7), UsageMaximum(3),
+        ReportSize(1), ReportCount(6),
+        Input(DataFlag.VARIABLE),
+    )
+    assert sum(isinstance(x, Usage) for x in result) == 3
+
+
+def test_push_pop() -> None:
+    items = (
+        UsagePage(UsagePages.GENERIC_DESKTOP),
+        ReportSize(8),
+        ReportCount(1),
+        Usage(GenericDesktop.X),
+        Input(DataFlag.VARIABLE),
+        Push(),
+        ReportSize(16),
+        ReportSize(8),
+        Usage(GenericDesktop.Y),
+        Input(DataFlag.VARIABLE),
+        Pop(),
+        # restates what Pop restored
+        ReportSize(8),
+        Usage(GenericDesktop.Z),
+        Input(DataFlag.VARIABLE),
+    )
+    result = _optimized(*items)
+    assert ReportSize(16) not in result
+    assert result.count(ReportSize(8)) == 1
+    assert Push() in result and Pop() in result
+
+
+def test_trailing_globals_are_dropped() -> None:
+    result = _optimized(
+        ReportSize(8), ReportCount(1), Usage(1), Input(DataFlag.VARIABLE),
+        ReportSize(16),
+    )
+    assert ReportSize(16) not in result
+
+
+def test_optimize_is_idempotent() -> None:
+    descriptor = ReportDescriptor(Keyboard.DESCRIPTOR)
+    assert descriptor.optimize().optimize() == descriptor.optimize()
@@ -0,0 +1,77 @@
+import pytest
+
+from hid.ring import Ring
+
+
+@pytest.fixture
+def ring(tmp_path):
+    r = Ring.create(str(tmp_path / 'test.ring'), capacity=4, max_report_len=8)
+    yield r
+    r.close()
+
+
+def _pop(ring: Ring, ok: bool = True) -> tuple[int, int, bytes]:
+    entry = ring.peek()
+    assert entry is not None
+    seq, device, view = entry
+    report = bytes(view)
+    view.release()
+    ring.pop(ok)
+    return seq, device, report
+
+
+def test_push_and_pop(ring: Ring) -> None:
+    assert ring.peek() is None
+    assert ring.push(2, b'abc') == 1
+    assert len(ring) == 1
+    assert _pop(ring) == (1, 2, b'abc')
+    assert len(ring) == 0
+    assert ring.tail == 1
+
+
+def test_full(ring: Ring) -> None:
+    for i in range(4):
+        assert ring.push(0, bytes([i])) == i + 1
+    assert ring.push(0, b'x') is None
+    _pop(ring)
+    assert ring.push(0, b'x') == 5
+
+
+def test_wraparound(ring: Ring) -> None:
+    for i in range(25):
+        assert ring.push(i % 3, bytes([i]) * (i % 8 + 1)) == i + 1
+        assert _pop(ring) == (i + 1, i % 3, bytes([i]) * (i % 8 + 1))
+    assert ring.head == ring.tail == 25
+
+
+def test_report_too_long(ring: Ring) -> None:
+    with pytest.raises(ValueError):
+        ring.push(0, bytes(ring.max_report_len + 1))
+    assert len(ring) == 0
+
+
+def test_failed(ring: Ring) -> None:
+    for i in range(3):
+        ring.push(0, b'')
+    _pop(ring)
+    _pop(ring, ok=False)
+    _pop(ring)
+    assert ring.failed == 1
+    assert ring.last_failed == 2
+
+
+def test_shared(ring: Ring) -> None:
+    consumer = Ring.open(ring.path)
+    try:
+        ring.push(1, b'hi')
+        assert _pop(consumer) == (1, 1, b'hi')
+        assert ring.tail == 1
+    finally:
+        consumer.close()
+
+
+def test_not_a_ring(tmp_path) -> None:
+    path = tmp_path / 'x.ring'
+    path.write_bytes(bytes(256))
+    with pytest.raises(ValueError):
+        Ring.open(str(path))
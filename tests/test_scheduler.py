@@ -0,0 +1,179 @@
+import threading
+import time
+
+import pytest
+
+from hid.devices import Keyboard, Mouse
+from hid.devices.keyboard import Modifier
+from hid.devices.mouse import MouseButton
+from hid.scheduler import FrameScheduler
+from hid.transport import LoopbackTransport
+from .conftest import received
+from hid.udc import UDCState, CONFIGURED, SUSPENDED
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def devices():
+    keyboard, mouse = Keyboard('kb'), Mouse('mouse')
+    for d in (keyboard, mouse):
+        d.transport = LoopbackTransport()
+    yield keyboard, mouse
+    for d in (keyboard, mouse):
+        d.close()
+
+
+def test_keyboard_press_and_release(devices) -> None:
+    keyboard, _ = devices
+    keyboard.press(Modifier.LEFT_CONTROL, 'c')
+    assert bytes(keyboard.report) == bytes([Modifier.LEFT_CONTROL, 0, 0x06, 0, 0, 0, 0, 0])
+    keyboard.press('A')
+    assert keyboard.report.mods == Modifier.LEFT_CONTROL | Modifier.LEFT_SHIFT
+    assert list(keyboard.report.keys) == [0x06, 0x04, 0, 0, 0, 0]
+    keyboard.release('c', Modifier.LEFT_CONTROL)
+    assert keyboard.report.mods == Modifier.LEFT_SHIFT
+    assert list(keyboard.report.keys) == [0, 0x04, 0, 0, 0, 0]
+    keyboard.release_all()
+    assert bytes(keyboard.report) == bytes(8)
+    # nothing was sent
+    assert received(keyboard) == []
+
+
+def test_keyboard_rollover(devices) -> None:
+    keyboard, _ = devices
+    keyboard.press(*'abcdef')
+    with pytest.raises(ValueError):
+        keyboard.press('g')
+    with pytest.raises(KeyError):
+        keyboard.press('\0')
+
+
+def test_held_shift_survives_shifted_characters(devices) -> None:
+    keyboard, _ = devices
+    keyboard.press(Modifier.LEFT_SHIFT)
+    keyboard.press('A').release('A')
+    assert keyboard.report.mods == Modifier.LEFT_SHIFT
+    # typing keeps it held too, and uses a free slot
+    keyboard.press('x')
+    keyboard.type('a')
+    assert received(keyboard) == [
+        bytes([Modifier.LEFT_SHIFT, 0, 0x1B, 0x04, 0, 0, 0, 0]),
+        bytes([Modifier.LEFT_SHIFT, 0, 0x1B, 0, 0, 0, 0, 0]),
+    ]
+    keyboard.release(Modifier.LEFT_SHIFT).press('A').release('A')
+    assert keyboard.report.mods == 0
+
+
+def test_mouse_press_release_and_motion(devices) -> None:
+    _, mouse = devices
+    mouse.press(MouseButton.LEFT).press(MouseButton.MIDDLE).set_motion(3, -4)
+    assert bytes(mouse.report) == bytes([MouseButton.LEFT | MouseButton.MIDDLE, 3, 0xfc])
+    mouse.release(MouseButton.LEFT).set_motion()
+    assert bytes(mouse.report) == bytes([MouseButton.MIDDLE, 0, 0])
+    with pytest.raises(ValueError):
+        mouse.set_motion(128, 0)
+    assert received(mouse) == []
+
+
+def test_shift_drag(devices) -> None:
+    keyboard, mouse = devices
+    clock = FakeClock()
+    scheduler = FrameScheduler(devices, interval=0.004, clock=clock, sleep=clock.sleep)
+
+    sent: list[tuple[float, str]] = []
+    for d in devices:
+        original = d.send_report
+        d.send_report = lambda report=None, d=d, original=original: (sent.append((clock.now, d.name)), original(report))
+
+    # mouse first, but the keyboard's report still goes out first within the frame
+    mouse.press()
+    keyboard.press(Modifier.LEFT_SHIFT)
+    scheduler.commit()
+    for _ in range(3):
+        mouse.set_motion(5, 0)
+        scheduler.commit(mouse)
+    mouse.set_motion().release()
+    keyboard.release(Modifier.LEFT_SHIFT)
+    scheduler.commit()
+    assert len(scheduler) == 5
+
+    scheduler.run()
+    assert [name for _, name in sent] == ['kb', 'mouse', 'mouse', 'mouse', 'mouse', 'kb', 'mouse']
+    frames = sorted({t for t, _ in sent})
+    assert frames == pytest.approx([0.004 * i for i in range(5)])
+
+    assert received(keyboard) == [bytes([Modifier.LEFT_SHIFT]) + bytes(7), bytes(8)]
+    assert received(mouse) == [b'\x01\x00\x00'] + [b'\x01\x05\x00'] * 3 + [b'\x00\x00\x00']
+
+
+def test_motion_is_sent_once(devices) -> None:
+    _, mouse = devices
+    clock = FakeClock()
+    scheduler = FrameScheduler(devices, clock=clock, sleep=clock.sleep)
+    mouse.set_motion(10, 0)
+    scheduler.commit()
+    assert (mouse.report.x, mouse.report.y) == (0, 0)
+    scheduler.run()
+    mouse.frequency = 10_000
+    mouse.click()
+    assert received(mouse) == [b'\x00\x0a\x00', b'\x01\x00\x00', b'\x00\x00\x00']
+
+    # the same motion again is a change, and nothing is committed without one
+    mouse.set_motion(10, 0)
+    scheduler.commit()
+    scheduler.commit()
+    assert len(scheduler) == 1
+
+
+def test_commit_only_changed(devices) -> None:
+    keyboard, mouse = devices
+    scheduler = FrameScheduler(devices)
+    scheduler.commit()
+    assert len(scheduler) == 0
+    mouse.press()
+    scheduler.commit()
+    scheduler.commit()
+    assert len(scheduler) == 1
+    assert scheduler.tick()
+    assert not scheduler.tick()
+    assert received(mouse) == [b'\x01\x00\x00']
+    assert received(keyboard) == []
+
+
+def test_held_while_suspended(devices, configfs) -> None:
+    _, mouse = devices
+    configfs.set_state(CONFIGURED)
+    udc = UDCState(configfs.state_path)
+    try:
+        scheduler = FrameScheduler(devices, udc=udc)
+        # the state is watched from here on, not just read once
+        assert udc.running
+        configfs.set_state(SUSPENDED)
+        deadline = time.monotonic() + 1
+        while udc.state != SUSPENDED and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert udc.state == SUSPENDED
+
+        mouse.press()
+        scheduler.commit()
+        thread = threading.Thread(target=scheduler.run)
+        thread.start()
+        time.sleep(0.05)
+        assert received(mouse) == []
+
+        configfs.set_state(CONFIGURED)
+        thread.join(1)
+        assert not thread.is_alive()
+        assert received(mouse) == [b'\x01\x00\x00']
+    finally:
+        udc.stop()
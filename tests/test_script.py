@@ -0,0 +1,121 @@
+import pytest
+
+from hid.devices import Keyboard, Mouse
+from hid.devices.keyboard import KeyCode, Modifier
+from hid.script import Timeline, compile_script
+from hid.transport import LoopbackTransport
+from .conftest import received
+
+MS = 1_000_000
+RELEASED = bytes(8)
+
+
+def _key(mods: int, *keys: int) -> bytes:
+    return bytes([mods, 0, *keys]) + bytes(6 - len(keys))
+
+
+def _events(timeline: Timeline) -> list[tuple[int, str, bytes]]:
+    return [(t, timeline.devices[i], r) for t, i, r in zip(timeline.times, timeline.targets, timeline.reports)]
+
+
+def test_string() -> None:
+    timeline = compile_script('STRING aB')
+    assert _events(timeline) == [
+        (0, 'keyboard', _key(0, 0x04)),
+        (4 * MS, 'keyboard', RELEASED),
+        (8 * MS, 'keyboard', _key(Modifier.LEFT_SHIFT, 0x05)),
+        (12 * MS, 'keyboard', RELEASED),
+    ]
+    assert timeline.duration == 12 * MS
+
+
+def test_stringln() -> None:
+    timeline = compile_script('STRINGLN x')
+    assert timeline.reports[::2] == [_key(0, KeyCode.KEYBOARD['x']), _key(0, KeyCode.KEYBOARD['ENTER'])]
+
+
+@pytest.mark.parametrize('line, report', [
+    ('CTRL-ALT DELETE', _key(Modifier.LEFT_CONTROL | Modifier.LEFT_ALT, KeyCode.KEYBOARD['DELETE'])),
+    ('GUI r', _key(Modifier.LEFT_GUI, KeyCode.KEYBOARD['r'])),
+    # letters in chords are keys, not capitals
+    ('CTRL C', _key(Modifier.LEFT_CONTROL, KeyCode.KEYBOARD['c'])),
+    ('CTRL -', _key(Modifier.LEFT_CONTROL, KeyCode.KEYBOARD['-'])),
+    ('-', _key(0, KeyCode.KEYBOARD['-'])),
+    ('ESC', _key(0, KeyCode.KEYBOARD['ESCAPE'])),
+    ('SHIFT', _key(Modifier.LEFT_SHIFT)),
+])
+def test_chords(line: str, report: bytes) -> None:
+    assert compile_script(line).reports == [report, RELEASED]
+
+
+def test_delays() -> None:
+    timeline = compile_script('a\nDELAY 100\nDEFAULT_DELAY 10\nb\nc')
+    assert timeline.times.tolist() == [0, 4 * MS, 108 * MS, 112 * MS, 126 * MS, 130 * MS]
+
+
+def test_repeat() -> None:
+    timeline = compile_script('REM comments are skipped\nENTER\nREPEAT 2')
+    assert len(timeline) == 6
+    assert timeline.reports[::2] == [_key(0, KeyCode.KEYBOARD['ENTER'])] * 3
+
+
+def test_mouse_move_is_subdivided() -> None:
+    timeline = compile_script('MOUSE_MOVE 300 -21')
+    assert timeline.reports == [bytes([0, 100, 256 - 7])] * 3
+    assert timeline.devices == ['mouse']
+
+    # spread over the given number of milliseconds
+    timeline = compile_script('MOUSE_MOVE 10 0 20')
+    assert timeline.reports == [bytes([0, 2, 0])] * 5
+
+
+def test_mouse_buttons() -> None:
+    timeline = compile_script('MOUSE_CLICK\nMOUSE_PRESS MIDDLE\nMOUSE_MOVE 5 0\nMOUSE_RELEASE MIDDLE')
+    assert timeline.reports == [b'\x01\x00\x00', b'\x00\x00\x00', b'\x02\x00\x00', b'\x02\x05\x00', b'\x00\x00\x00']
+
+
+@pytest.mark.parametrize('source, message', [
+    ('STRING a\nFOO', "Line 2: Unknown key: 'FOO'"),
+    ('REPEAT 3', 'Line 1: Nothing to repeat.'),
+    ('\nMOUSE_CLICK THUMB', "Line 2: Unknown mouse button: 'THUMB'"),
+    ('MOUSE_MOVE 1', 'Line 1: MOUSE_MOVE takes x, y and an optional duration in ms.'),
+    ('MOUSE_MOVE 1000 0 4', "Line 1: Can't move that fast"),
+    ('a b c d e f g', 'Line 1: At most 6 keys can be pressed at once.'),
+    ('STRING é', "Line 1: Can't type 'é'"),
+    ('DELAY soon', 'Line 1: could not convert string to float'),
+])
+def test_errors(source: str, message: str) -> None:
+    with pytest.raises(ValueError, match=f'^{message}'):
+        compile_script(source)
+
+
+class FakeClock:
+    # every reading takes a microsecond, so spinning on the clock terminates
+    def __init__(self) -> None:
+        self.now = 0
+        self.slept: list[float] = []
+
+    def __call__(self) -> int:
+        self.now += 1000
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += round(seconds * 1e9)
+
+
+def test_play() -> None:
+    keyboard, mouse = Keyboard('kb'), Mouse('m')
+    keyboard.transport = LoopbackTransport()
+    mouse.transport = LoopbackTransport()
+    timeline = compile_script('STRING a\nDELAY 50\nMOUSE_CLICK')
+    clock = FakeClock()
+    late = timeline.play({'keyboard': keyboard, 'mouse': mouse}, clock=clock, sleep=clock.sleep)
+
+    assert received(keyboard) == [_key(0, 0x04), RELEASED]
+    assert received(mouse) == [b'\x01\x00\x00', b'\x00\x00\x00']
+    assert 0 <= late < 0.0002 * 1e9
+    # the long wait before the click is slept through, all but the last 0.2 ms
+    assert max(clock.slept) == pytest.approx(0.054 - 0.0002, abs=1e-5)
+    keyboard.close()
+    mouse.close()
@@ -0,0 +1,108 @@
+import io
+import json
+from collections import Counter
+from ctypes import sizeof
+
+import pytest
+
+from hid import trace
+from hid.devices import Keyboard, Mouse
+from hid.gadget import Gadget
+from hid.transport import LoopbackTransport
+
+
+@pytest.fixture
+def tracing():
+    trace.enable(1024)
+    yield
+    trace.disable()
+    trace.clear()
+
+
+def _assert_balanced() -> None:
+    phases = Counter((e['name'], e['ph']) for e in trace.events())
+    for (name, phase), n in phases.items():
+        if phase == 'B':
+            assert phases[name, 'E'] == n, name
+
+
+def test_name_argument(tracing) -> None:
+    trace.begin('span', name='argument')
+    trace.end('span', name='argument')
+    trace.instant('instant', name='argument')
+    with trace.span('with', name='argument'):
+        pass
+    assert [e.get('args') for e in trace.events()] == [{'name': 'argument'}] * 4 + [None]
+
+
+def test_span_closes_on_error(tracing) -> None:
+    with pytest.raises(RuntimeError):
+        with trace.span('failing'):
+            raise RuntimeError
+    assert [e['ph'] for e in trace.events()] == ['B', 'E']
+
+
+def test_disabled() -> None:
+    with trace.span('ignored'):
+        pass
+    assert trace.events() == []
+
+
+def test_dump(tracing) -> None:
+    with trace.span('outer'):
+        trace.instant('inside', value=1)
+    f = io.StringIO()
+    trace.dump(f)
+    events = json.loads(f.getvalue())['traceEvents']
+    assert [(e['name'], e['ph']) for e in events] == [('outer', 'B'), ('inside', 'i'), ('outer', 'E')]
+
+
+def test_keyboard_unknown_character(tracing) -> None:
+    keyboard = Keyboard('kb')
+    keyboard.transport = LoopbackTransport()
+    with pytest.raises(KeyError):
+        keyboard.type('a\x00')
+    _assert_balanced()
+    # nothing is left pressed
+    assert bytes(keyboard.report) == bytes(sizeof(keyboard.report))
+    keyboard.close()
+
+
+def test_mouse_move(tracing) -> None:
+    mouse = Mouse('m', frequency=1000)
+    mouse.transport = LoopbackTransport()
+    mouse.move(3, -3, t=0.003)
+    names = [(e['name'], e['ph']) for e in trace.events()]
+    assert names[0] == ('Mouse.move', 'B') and names[-1] == ('Mouse.move', 'E')
+    assert names.count(('report written', 'i')) == 3
+    mouse.close()
+
+
+def test_gadget(tracing, configfs) -> None:
+    configfs.prepare('g', 'kb')
+    gadget = Gadget([Keyboard('kb')], path=configfs.path, name='g')
+    assert gadget.kb.dev == '/dev/hidg0'
+    assert ('Gadget.add_function', 'B') in [(e['name'], e['ph']) for e in trace.events()]
+    _assert_balanced()
+
+
+def test_gadget_error(tracing, configfs) -> None:
+    # clashes with Gadget.close
+    configfs.prepare('g', 'close')
+    with pytest.raises(ValueError):
+        Gadget([Keyboard('close')], path=configfs.path, name='g')
+    _assert_balanced()
+
+
+def test_disabled_span_is_shared() -> None:
+    assert trace.span('a') is trace.span('b', value=1)
+
+
+def test_record_before_enable(monkeypatch) -> None:
+    # a fresh module has no ring to record into
+    monkeypatch.setattr(trace, '_capacity', 0)
+    trace.begin('ignored')
+    trace.end('ignored')
+    trace.instant('ignored', value=1)
+    trace.sleep(0)
+    assert trace.events() == []
@@ -0,0 +1,95 @@
+import threading
+import time
+
+import pytest
+
+from hid import udc as udc_module
+from hid.devices import Keyboard
+from hid.gadget import Gadget
+from hid.udc import UDCState, CONFIGURED, NOT_ATTACHED, SUSPENDED
+
+
+@pytest.fixture(params=['inotify', 'polling'])
+def watcher(request, monkeypatch) -> None:
+    if request.param == 'polling':
+        monkeypatch.setattr(udc_module, '_inotify', lambda directory: None)
+
+
+@pytest.fixture
+def gadget(configfs, watcher):
+    configfs.prepare('g', 'kb')
+    gadget = Gadget([Keyboard('kb')], path=configfs.path, name='g')
+    yield gadget
+    gadget.udc_state.stop()
+
+
+def _later(f, *args, delay: float = 0.02) -> threading.Timer:
+    timer = threading.Timer(delay, f, args)
+    timer.start()
+    return timer
+
+
+def _wait_until(condition, timeout: float = 1) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+
+def test_missing_state_file(tmp_path) -> None:
+    assert UDCState(str(tmp_path / 'state')).state == NOT_ATTACHED
+
+
+def test_state_without_watcher(gadget, configfs) -> None:
+    assert gadget.state == NOT_ATTACHED
+    configfs.set_state(SUSPENDED)
+    # read from the file while nothing is watching it
+    assert gadget.suspended
+
+
+def test_wait_configured(gadget, configfs) -> None:
+    assert not gadget.wait_configured(timeout=0.01)
+    _later(configfs.set_state, CONFIGURED)
+    assert gadget.wait_configured(timeout=1)
+    assert gadget.state == CONFIGURED
+
+
+def test_already_configured(gadget, configfs) -> None:
+    configfs.set_state(CONFIGURED)
+    assert gadget.wait_configured(timeout=0)
+
+
+def test_suspend_and_resume_callbacks(gadget, configfs) -> None:
+    changes = []
+    gadget.on_state_change(lambda old, new: changes.append((old, new)))
+    for state in (CONFIGURED, SUSPENDED, CONFIGURED):
+        configfs.set_state(state)
+        assert _wait_until(lambda: gadget.state == state)
+    assert changes == [(NOT_ATTACHED, CONFIGURED), (CONFIGURED, SUSPENDED), (SUSPENDED, CONFIGURED)]
+
+
+def test_failing_callback_keeps_watching(gadget, configfs, monkeypatch) -> None:
+    errors = []
+    monkeypatch.setattr(threading, 'excepthook', lambda args: errors.append(args.exc_type))
+
+    def fail(old: str, new: str) -> None:
+        raise RuntimeError
+
+    gadget.on_state_change(fail)
+    configfs.set_state(CONFIGURED)
+    assert gadget.wait_configured(timeout=1)
+    configfs.set_state(SUSPENDED)
+    assert gadget.udc_state.wait_for((SUSPENDED,), timeout=1)
+    assert errors == [RuntimeError, RuntimeError]
+
+
+def test_stop_and_restart(gadget, configfs) -> None:
+    state = gadget.udc_state
+    state.start()
+    assert state.running
+    state.stop()
+    assert not state.running
+    configfs.set_state(CONFIGURED)
+    assert state.wait_for((CONFIGURED,), timeout=1)
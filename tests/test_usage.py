@@ -0,0 +1,136 @@
+import importlib.util
+import io
+import json
+import os
+import sys
+
+import pytest
+
+from hid.devices import Mouse
+from hid.report._usage_tables import PAGES
+from hid.report.usage import (GeneratedUsageTable, GenericDesktop, UsagePages, UsageTable, extended_usage_name,
+                              page_name, usage_id, usage_name, usage_table)
+
+TOOL = os.path.join(os.path.dirname(__file__), os.pardir, 'tools', 'usage_tables.py')
+
+
+@pytest.mark.parametrize('page', sorted(PAGES))
+def test_tables_are_well_formed(page: int) -> None:
+    name, usages = PAGES[page]
+    if not isinstance(usages, str):
+        return
+    ids = [int(line[:4], 16) for line in usages.splitlines()]
+    assert ids == sorted(set(ids))
+    assert all(line[4] == ' ' and line[5:] for line in usages.splitlines())
+
+
+def test_enums_match_tables() -> None:
+    for page in UsagePages:
+        assert page in PAGES
+    for usage in GenericDesktop:
+        assert usage_name(UsagePages.GENERIC_DESKTOP, usage) is not None, usage
+
+
+def test_lookup_both_ways() -> None:
+    assert usage_name(UsagePages.GENERIC_DESKTOP, GenericDesktop.X) == 'X'
+    assert usage_id('generic desktop', 'mouse') == GenericDesktop.MOUSE
+    assert extended_usage_name(UsagePages.GENERIC_DESKTOP << 16 | GenericDesktop.WHEEL) == 'Wheel'
+    assert usage_name(UsagePages.GENERIC_DESKTOP, 0x0003) is None
+    with pytest.raises(KeyError):
+        usage_id(UsagePages.GENERIC_DESKTOP, 'Not a usage')
+    with pytest.raises(KeyError):
+        usage_table('Not a page')
+
+
+def test_numbered_page() -> None:
+    table = usage_table(UsagePages.BUTTON)
+    assert table.name_of(3) == 'Button 3'
+    assert table.id_of('button 3') == 3
+    assert table.name_of(0) == table.zero
+    assert table.id_of('Button 0') is None
+    assert len(table) == len(list(table))
+
+
+def test_page_names() -> None:
+    assert page_name(UsagePages.BUTTON) == 'Button'
+    assert page_name(0xFF00) == 'Vendor-defined 0xFF00'
+    assert page_name(0x0013) is None
+
+
+def test_describe() -> None:
+    lines = Mouse.DESCRIPTOR.describe().splitlines()
+    assert lines[0] == 'Usage Page (Generic Desktop)'
+    assert 'Usage (Mouse)' in lines
+    assert any(line.strip() == 'Usage Page (Button)' for line in lines)
+
+
+@pytest.fixture(scope='module')
+def tool():
+    spec = importlib.util.spec_from_file_location('usage_tables', TOOL)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _generate(tool, tmp_path, monkeypatch, pages: list) -> dict:
+    tables = tmp_path / 'HidUsageTables.json'
+    # the published file starts with a byte order mark
+    tables.write_text(json.dumps({'UsagePages': pages}), encoding='utf-8-sig')
+    output = tmp_path / '_usage_tables.py'
+    monkeypatch.setattr(sys, 'argv', ['usage_tables.py', str(tables), '-o', str(output)])
+    tool.main()
+    namespace: dict = {}
+    exec(compile(output.read_text(), str(output), 'exec'), namespace)
+    return namespace['PAGES']
+
+
+def test_write_page(tool) -> None:
+    out = io.StringIO()
+    tool.write_page(out, {'Kind': 'Defined', 'Id': 0x59, 'Name': 'Lighting And Illumination', 'UsageIds': [
+        {'Id': 0x02, 'Name': 'LampArrayAttributesReport', 'Kinds': ['CL']},
+        {'Id': 0x01, 'Name': 'LampArray', 'Kinds': ['CA']},
+    ], 'UsageIdGenerator': None})
+    tool.write_page(out, {'Kind': 'Generated', 'Id': 0x0A, 'Name': 'Ordinal', 'UsageIds': [],
+                          'UsageIdGenerator': {'NamePrefix': 'Instance ', 'StartUsageId': 1, 'EndUsageId': 65535}})
+    assert out.getvalue() == (
+        "    0x0059: ('Lighting And Illumination', " '"""\\\n'
+        '0001 LampArray\n'
+        '0002 LampArrayAttributesReport\n'
+        '"""),\n'
+        "    0x000A: ('Ordinal', ('Instance', 1, 65535, None)),\n"
+    )
+
+
+def test_generate(tool, tmp_path, monkeypatch) -> None:
+    pages = _generate(tool, tmp_path, monkeypatch, [
+        {'Kind': 'Generated', 'Id': 0x09, 'Name': 'Button', 'UsageIds': [{'Id': 0, 'Name': 'No Button Pressed'}],
+         'UsageIdGenerator': {'NamePrefix': 'Button', 'StartUsageId': 1, 'EndUsageId': 65535}},
+        {'Kind': 'Defined', 'Id': 0x01, 'Name': 'Generic Desktop', 'UsageIds': [
+            {'Id': 0x31, 'Name': 'Y'}, {'Id': 0x30, 'Name': 'X'}, {'Id': 0x32, 'Name': 'Back\\slash'},
+        ], 'UsageIdGenerator': None},
+        {'Kind': 'Defined', 'Id': 0x85, 'Name': 'Battery System', 'UsageIds': [], 'UsageIdGenerator': None},
+    ])
+    assert list(pages) == [0x01, 0x09, 0x85]
+
+    desktop = UsageTable(0x01, *pages[0x01])
+    assert list(desktop) == [(0x30, 'X'), (0x31, 'Y'), (0x32, 'Back\\slash')]
+    button = GeneratedUsageTable(0x09, pages[0x09][0], *pages[0x09][1])
+    assert button.name_of(0) == 'No Button Pressed' and button.name_of(7) == 'Button 7'
+    assert len(UsageTable(0x85, *pages[0x85])) == 0
+
+
+def test_shipped_tables_round_trip(tool, tmp_path, monkeypatch) -> None:
+    # the hand-written tables are in the generator's format, so regenerating replaces them cleanly
+    pages = []
+    for page, (name, usages) in PAGES.items():
+        if isinstance(usages, str):
+            ids = [{'Id': int(line[:4], 16), 'Name': line[5:]} for line in usages.splitlines()]
+            pages.append({'Kind': 'Defined', 'Id': page, 'Name': name, 'UsageIds': ids, 'UsageIdGenerator': None})
+        else:
+            prefix, first, last, zero = usages
+            ids = [] if zero is None else [{'Id': 0, 'Name': zero}]
+            generator = {'NamePrefix': prefix, 'StartUsageId': first, 'EndUsageId': last}
+            pages.append({'Kind': 'Generated', 'Id': page, 'Name': name, 'UsageIds': ids,
+                          'UsageIdGenerator': generator})
+    assert _generate(tool, tmp_path, monkeypatch, pages) == PAGES
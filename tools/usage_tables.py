@@ -0,0 +1,64 @@
+"""Generate src/hid/report/_usage_tables.py from the JSON edition of the HID Usage Tables.
+
+    python tools/usage_tables.py HidUsageTables.json
+
+The JSON file is published by the USB-IF alongside the HID Usage Tables document.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from typing import Any, TextIO
+
+OUTPUT = os.path.join(os.path.dirname(__file__), os.pardir, 'src', 'hid', 'report', '_usage_tables.py')
+
+HEADER = '''\
+# Generated by tools/usage_tables.py from the HID Usage Tables, do not edit.
+#
+# PAGES maps a usage page ID to (name, usages). For most pages, usages is a string
+# of "ID Name" lines with 4 digit hex IDs, sorted by ID, which hid.report.usage
+# parses into a table the first time the page is looked up. Pages whose usages are
+# numbered instead of named (Button, Ordinal, ...) store (prefix, first, last, name
+# of usage 0) instead.
+
+from __future__ import annotations
+
+from typing import Optional, Union
+'''
+
+
+def write_page(out: TextIO, page: dict[str, Any]) -> None:
+    name = page['Name']
+    generator = page.get('UsageIdGenerator')
+    if generator:
+        zero = next((u['Name'] for u in page.get('UsageIds', ()) if u['Id'] == 0), None)
+        usages = (generator['NamePrefix'].strip(), generator['StartUsageId'], generator['EndUsageId'], zero)
+        out.write(f'    0x{page["Id"]:04X}: ({name!r}, {usages!r}),\n')
+        return
+
+    out.write(f'    0x{page["Id"]:04X}: ({name!r}, """\\\n')
+    for usage in sorted(page.get('UsageIds', ()), key=lambda u: u['Id']):
+        out.write(f'{usage["Id"]:04X} {usage["Name"]}\n'.replace('\\', '\\\\'))
+    out.write('"""),\n')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('tables', help='HidUsageTables.json')
+    parser.add_argument('-o', '--output', default=OUTPUT)
+    args = parser.parse_args()
+
+    with open(args.tables, 'rt', encoding='utf-8-sig') as f:
+        tables = json.load(f)
+
+    with open(args.output, 'wt') as out:
+        out.write(HEADER)
+        out.write('\nPAGES: dict[int, tuple[str, Union[str, tuple[str, int, int, Optional[str]]]]] = {\n')
+        for page in sorted(tables['UsagePages'], key=lambda p: p['Id']):
+            write_page(out, page)
+        out.write('}\n')
+
+
+if __name__ == '__main__':
+    main()